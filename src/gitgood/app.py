@@ -1,12 +1,15 @@
 """Main application orchestrator."""
 
 import signal
+from typing import Optional
+
+from rich.panel import Panel
 
 from .core.repository import VirtualRepository
 from .core.github_api import SimulatedGitHub
 from .parser.lexer import CommandLexer, ParseError
 from .parser.executor import CommandExecutor
-from .lessons.engine import LessonEngine, StepType, Lesson
+from .lessons.engine import LessonEngine, LessonStep, StepType
 from .lessons.loader import load_lessons_from_directory, get_default_lessons_dir
 from .ui.console import GitGoodConsole
 from .ui.prompt import CommandPrompt
@@ -27,6 +30,18 @@ class GitGoodApp:
         self.prompt = CommandPrompt()
         self.tree_renderer = CommitTreeRenderer(self.repo)
         self.running = True
+        # Last rendered status/tree panels, keyed by the state they show
+        self._status_panel_cache: tuple[tuple, Panel] | None = None
+        self._tree_panel_cache: tuple[tuple, Panel] | None = None
+        self._commands = {
+            "quit": self._quit,
+            "exit": self._quit,
+            "lessons": self._open_lessons,
+            "hint": self._show_hint,
+            "skip": self._skip_step,
+            "status": self._show_status,
+            "tree": self._show_tree,
+        }
 
         # Register resize handler
         signal.signal(signal.SIGWINCH, self._on_resize)
@@ -41,10 +56,10 @@ class GitGoodApp:
 
         # Load lessons
         lessons_dir = get_default_lessons_dir()
-        count = load_lessons_from_directory(lessons_dir, self.lesson_engine)
+        count = load_lessons_from_directory(lessons_dir, self.lesson_engine, lazy=True)
 
         if count > 0:
-            self.console.print_info(f"Loaded {count} lesson(s). Type 'lessons' to start learning!")
+            self.console.print_info(f"Found {count} lesson file(s). Type 'lessons' to start learning!")
         else:
             self.console.print_warning(
                 "No lessons found. You can still practice git commands freely."
@@ -58,6 +73,7 @@ class GitGoodApp:
                 self._run_iteration()
             except KeyboardInterrupt:
                 self.console.console.print()
+                self.console.invalidate()
                 continue
             except EOFError:
                 break
@@ -74,20 +90,18 @@ class GitGoodApp:
             # For explanation steps, just wait for enter
             if step.step_type == StepType.EXPLANATION:
                 self.prompt.get_simple_input("Press Enter to continue...")
+                self.console.invalidate()
 
-                # Save current lesson before advancing (it gets cleared on completion)
-                completed_lesson = self.lesson_engine.current_lesson
-
-                self.lesson_engine.advance_step()
-
-                # Check if lesson is complete
-                if not self.lesson_engine.get_current_step():
-                    self._handle_lesson_complete(completed_lesson)
+                # advance_step returns None once the lesson is complete
+                if not self.lesson_engine.advance_step():
+                    self._handle_lesson_complete()
                 return
 
         # Get user input
         current_branch = self.repo.get_current_branch()
         user_input = self.prompt.get_input(current_branch)
+        # The prompt line is still on screen until the next redraw paints over it
+        self.console.invalidate()
 
         if not user_input:
             return
@@ -95,44 +109,24 @@ class GitGoodApp:
         # Track the input in output buffer
         self.console.add_input_line(f"$ ({current_branch}) {user_input}")
 
-        # Handle internal commands
-        if user_input.lower() in ("quit", "exit"):
-            self.running = False
-            return
-
-        if user_input.lower() == "lessons":
-            self.lesson_engine.end_lesson()
-            self._show_lessons()
-            return
-
-        if user_input.lower().startswith("lesson "):
-            parts = user_input.split(maxsplit=1)
-            if len(parts) > 1:
-                self._start_lesson(parts[1])
-            return
-
-        if user_input.lower() == "hint":
-            hint = self.lesson_engine.get_hint()
-            self.console.print_info(hint)
-            return
-
-        if user_input.lower() == "skip":
-            if self.lesson_engine.is_lesson_active():
-                # Save current lesson before advancing (it gets cleared on completion)
-                completed_lesson = self.lesson_engine.current_lesson
-
-                self.lesson_engine.advance_step()
-                self.console.print_warning("Skipped current step.")
-                if not self.lesson_engine.get_current_step():
-                    self._handle_lesson_complete(completed_lesson)
-            return
-
-        if user_input.lower() == "status":
-            self._show_status()
-            return
+        # Everything printed in response to one input is drawn in one redraw
+        with self.console.batch():
+            self._handle_input(user_input, step)
 
-        if user_input.lower() == "tree":
-            self._show_tree()
+    def _handle_input(self, user_input: str, step: Optional[LessonStep]) -> None:
+        """Dispatch one line of user input."""
+        # Handle internal commands
+        word, _, rest = user_input.partition(" ")
+        word = word.lower()
+        if not rest:
+            handler = self._commands.get(word)
+            if handler:
+                handler()
+                return
+        elif word == "lesson":
+            lesson_ref = rest.strip()
+            if lesson_ref:
+                self._start_lesson(lesson_ref)
             return
 
         # Validate against lesson if active
@@ -144,15 +138,9 @@ class GitGoodApp:
                 self._execute_command(user_input)
                 self.console.print_success(validation.message)
 
-                # Save current lesson before advancing (it gets cleared on completion)
-                completed_lesson = self.lesson_engine.current_lesson
-
-                # Advance to next step
-                self.lesson_engine.advance_step()
-
-                # Check if lesson is complete
-                if not self.lesson_engine.get_current_step():
-                    self._handle_lesson_complete(completed_lesson)
+                # Advance to next step; None means the lesson is complete
+                if not self.lesson_engine.advance_step():
+                    self._handle_lesson_complete()
             else:
                 self.console.print_error(validation.message)
                 self.console.print_hint(validation.hints)
@@ -160,6 +148,29 @@ class GitGoodApp:
             # Free-form mode - just execute
             self._execute_command(user_input)
 
+    def _quit(self) -> None:
+        """Stop the main loop."""
+        self.running = False
+
+    def _open_lessons(self) -> None:
+        """End any active lesson and show the lesson list."""
+        self.lesson_engine.end_lesson()
+        self._show_lessons()
+
+    def _show_hint(self) -> None:
+        """Show a hint for the current step."""
+        hint = self.lesson_engine.get_hint()
+        self.console.print_info(hint)
+
+    def _skip_step(self) -> None:
+        """Skip the current lesson step."""
+        if self.lesson_engine.is_lesson_active():
+            next_step = self.lesson_engine.advance_step()
+            with self.console.batch():
+                self.console.print_warning("Skipped current step.")
+                if not next_step:
+                    self._handle_lesson_complete()
+
     def _execute_command(self, user_input: str) -> None:
         """Parse and execute a command."""
         try:
@@ -170,13 +181,14 @@ class GitGoodApp:
                 self.running = False
                 return
 
-            if result.output:
-                self.console.print_command_output(result.output)
+            with self.console.batch():
+                if result.output:
+                    self.console.print_command_output(result.output)
 
-            if not result.success and result.message:
-                self.console.print_error(result.message)
-                if result.hints:
-                    self.console.print_hint(result.hints)
+                if not result.success and result.message:
+                    self.console.print_error(result.message)
+                    if result.hints:
+                        self.console.print_hint(result.hints)
 
         except ParseError as e:
             self.console.print_error(str(e))
@@ -212,10 +224,10 @@ class GitGoodApp:
             pass
 
         # Try by ID
-        for lesson in lessons:
-            if lesson.lesson_id == lesson_ref:
-                self._begin_lesson(lesson.lesson_id)
-                return
+        lesson = self.lesson_engine.get_lesson(lesson_ref)
+        if lesson:
+            self._begin_lesson(lesson.lesson_id)
+            return
 
         self.console.print_error(f"Lesson not found: {lesson_ref}")
 
@@ -227,6 +239,8 @@ class GitGoodApp:
         self.executor = CommandExecutor(self.repo, self.github)
         self.lesson_engine.repo = self.repo
         self.tree_renderer = CommitTreeRenderer(self.repo)
+        self._status_panel_cache = None
+        self._tree_panel_cache = None
 
         # Clear output buffer for fresh lesson
         self.console.clear_output_buffer()
@@ -243,23 +257,49 @@ class GitGoodApp:
                 self.console.print_error("Failed to start lesson.")
             return
 
-    def _handle_lesson_complete(self, lesson: Lesson | None) -> None:
+    def _handle_lesson_complete(self) -> None:
         """Handle lesson completion."""
-        if lesson:
-            self.console.print_lesson_complete(lesson.title)
+        lesson_id = self.lesson_engine.last_completed
+        lesson = self.lesson_engine.lessons.get(lesson_id) if lesson_id else None
+        with self.console.batch():
+            if lesson:
+                self.console.print_lesson_complete(lesson.title)
 
-        # Check if all lessons are complete
-        if len(self.lesson_engine.completed_lessons) == len(self.lesson_engine.lessons):
-            self.console.print_all_complete()
+            # Check if all lessons are complete
+            if len(self.lesson_engine.completed_lessons) == len(self.lesson_engine.lesson_order):
+                self.console.print_all_complete()
 
     def _show_status(self) -> None:
         """Show repository status panel."""
-        panel = StatusPanel(self.repo).render()
+        status = self.repo.status()
+        key = (
+            status.current_branch,
+            status.upstream,
+            status.ahead,
+            status.behind,
+            tuple((c.filename, c.change_type) for c in status.staged),
+            tuple(status.unstaged),
+        )
+        if self._status_panel_cache and self._status_panel_cache[0] == key:
+            panel = self._status_panel_cache[1]
+        else:
+            panel = StatusPanel(self.repo).render(status)
+            self._status_panel_cache = (key, panel)
         self.console.print_panel(panel)
 
     def _show_tree(self) -> None:
         """Show commit tree."""
-        panel = self.tree_renderer.render()
+        state = self.repo.state
+        key = (
+            state.head,
+            tuple((name, b.commit_sha) for name, b in state.branches.items()),
+            tuple((name, b.commit_sha) for name, b in state.remote_branches.items()),
+        )
+        if self._tree_panel_cache and self._tree_panel_cache[0] == key:
+            panel = self._tree_panel_cache[1]
+        else:
+            panel = self.tree_renderer.render()
+            self._tree_panel_cache = (key, panel)
         self.console.print_panel(panel)
 
 
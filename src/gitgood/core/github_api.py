@@ -1,11 +1,38 @@
 """Simulated GitHub API operations."""
 
+import sys
 from typing import Optional
 
-from .models import CommandResult, PRStatus, PullRequest
+from .models import CommandResult, PRStatus, PullRequest, Review
 from .repository import VirtualRepository
 
 
+# Display text used in PR listings and merge/review output
+PR_STATUS_ICONS = {
+    PRStatus.OPEN: "O",
+    PRStatus.MERGED: "M",
+    PRStatus.CLOSED: "C",
+}
+
+MERGE_METHOD_TEXT = {
+    "merge": "Merged",
+    "squash": "Squashed and merged",
+    "rebase": "Rebased and merged",
+}
+
+# Review statuses, interned so every review shares the same string objects
+REVIEW_PENDING = sys.intern("pending")
+REVIEW_APPROVED = sys.intern("approved")
+REVIEW_REQUEST_CHANGES = sys.intern("request_changes")
+REVIEW_COMMENT = sys.intern("comment")
+
+REVIEW_STATUS_TEXT = {
+    REVIEW_APPROVED: "approved these changes",
+    REVIEW_REQUEST_CHANGES: "requested changes",
+    REVIEW_COMMENT: "commented",
+}
+
+
 class SimulatedGitHub:
     """
     Simulates GitHub operations like creating PRs, requesting reviews,
@@ -57,6 +84,8 @@ class SimulatedGitHub:
             target_branch=target,
         )
         self.repo.state.pull_requests[pr_number] = pr
+        self.repo.state.prs_by_status[pr.status.value].add(pr_number)
+        self.repo.state.prs_by_branch.setdefault(source_branch, []).append(pr_number)
 
         output = f"""
 Creating pull request for {source_branch} into {target} in learner/my-project
@@ -68,10 +97,12 @@ https://github.com/learner/my-project/pull/{pr_number}
 
     def list_pull_requests(self, state: str = "open") -> CommandResult:
         """List pull requests."""
-        prs = []
-        for pr in self.repo.state.pull_requests.values():
-            if state == "all" or pr.status.value == state:
-                prs.append(pr)
+        pull_requests = self.repo.state.pull_requests
+        if state == "all":
+            prs = list(pull_requests.values())
+        else:
+            numbers = self.repo.state.prs_by_status.get(state, ())
+            prs = [pull_requests[number] for number in sorted(numbers)]
 
         if not prs:
             return CommandResult(
@@ -79,19 +110,15 @@ https://github.com/learner/my-project/pull/{pr_number}
                 output="No pull requests match your search",
             )
 
-        lines = []
-        for pr in prs:
-            status_icon = {
-                PRStatus.OPEN: "O",
-                PRStatus.MERGED: "M",
-                PRStatus.CLOSED: "C",
-            }.get(pr.status, "?")
+        # One entry per PR (title line + branch line), joined once
+        entries = [
+            f"#{pr.number}  [{PR_STATUS_ICONS.get(pr.status, '?')}]  {pr.title}"
+            f"{' [APPROVED]' if pr.approved else ''}\n"
+            f"       {pr.source_branch} -> {pr.target_branch}"
+            for pr in prs
+        ]
 
-            approved = " [APPROVED]" if pr.approved else ""
-            lines.append(f"#{pr.number}  [{status_icon}]  {pr.title}{approved}")
-            lines.append(f"       {pr.source_branch} -> {pr.target_branch}")
-
-        return CommandResult(success=True, output="\n".join(lines))
+        return CommandResult(success=True, output="\n".join(entries))
 
     def merge_pull_request(
         self,
@@ -99,14 +126,13 @@ https://github.com/learner/my-project/pull/{pr_number}
         method: str = "merge",
     ) -> CommandResult:
         """Merge a pull request."""
-        if pr_number not in self.repo.state.pull_requests:
+        pr = self.repo.state.pull_requests.get(pr_number)
+        if pr is None:
             return CommandResult(
                 success=False,
                 message=f"error: pull request #{pr_number} not found",
             )
 
-        pr = self.repo.state.pull_requests[pr_number]
-
         if pr.status != PRStatus.OPEN:
             return CommandResult(
                 success=False,
@@ -117,13 +143,9 @@ https://github.com/learner/my-project/pull/{pr_number}
         self.repo.checkout(pr.target_branch)
         self.repo.merge(pr.source_branch)
 
-        pr.status = PRStatus.MERGED
+        self._set_status(pr, PRStatus.MERGED)
 
-        method_text = {
-            "merge": "Merged",
-            "squash": "Squashed and merged",
-            "rebase": "Rebased and merged",
-        }.get(method, "Merged")
+        method_text = MERGE_METHOD_TEXT.get(method, "Merged")
 
         return CommandResult(
             success=True,
@@ -132,21 +154,20 @@ https://github.com/learner/my-project/pull/{pr_number}
 
     def close_pull_request(self, pr_number: int) -> CommandResult:
         """Close a pull request without merging."""
-        if pr_number not in self.repo.state.pull_requests:
+        pr = self.repo.state.pull_requests.get(pr_number)
+        if pr is None:
             return CommandResult(
                 success=False,
                 message=f"error: pull request #{pr_number} not found",
             )
 
-        pr = self.repo.state.pull_requests[pr_number]
-
         if pr.status != PRStatus.OPEN:
             return CommandResult(
                 success=False,
                 message=f"error: pull request #{pr_number} is already {pr.status.value}",
             )
 
-        pr.status = PRStatus.CLOSED
+        self._set_status(pr, PRStatus.CLOSED)
 
         return CommandResult(
             success=True,
@@ -155,20 +176,19 @@ https://github.com/learner/my-project/pull/{pr_number}
 
     def request_review(self, pr_number: int, reviewers: list[str]) -> CommandResult:
         """Request reviews on a PR."""
-        if pr_number not in self.repo.state.pull_requests:
+        pr = self.repo.state.pull_requests.get(pr_number)
+        if pr is None:
             return CommandResult(
                 success=False,
                 message=f"error: pull request #{pr_number} not found",
             )
 
-        pr = self.repo.state.pull_requests[pr_number]
-
         for reviewer in reviewers:
-            pr.reviews.append({
-                "reviewer": reviewer,
-                "status": "pending",
-                "comment": "",
-            })
+            reviewer = sys.intern(reviewer)
+            review = Review(reviewer, status=REVIEW_PENDING)
+            pr.reviews.append(review)
+            # The first review from a reviewer is the one later updates apply to
+            pr.reviews_by_reviewer.setdefault(reviewer, review)
 
         return CommandResult(
             success=True,
@@ -183,41 +203,40 @@ https://github.com/learner/my-project/pull/{pr_number}
         comment: str = "",
     ) -> CommandResult:
         """Add a review to a PR (simulates teammate review)."""
-        if pr_number not in self.repo.state.pull_requests:
+        pr = self.repo.state.pull_requests.get(pr_number)
+        if pr is None:
             return CommandResult(
                 success=False,
                 message=f"error: pull request #{pr_number} not found",
             )
 
-        pr = self.repo.state.pull_requests[pr_number]
+        reviewer = sys.intern(reviewer)
+        status = sys.intern(status)
 
         # Update or add review
-        found = False
-        for review in pr.reviews:
-            if review["reviewer"] == reviewer:
-                review["status"] = status
-                review["comment"] = comment
-                found = True
-                break
-
-        if not found:
-            pr.reviews.append({
-                "reviewer": reviewer,
-                "status": status,
-                "comment": comment,
-            })
-
-        if status == "approved":
+        review = pr.reviews_by_reviewer.get(reviewer)
+        if review is not None:
+            review.status = status
+            review.comment = comment
+        else:
+            review = Review(reviewer, status=status, comment=comment)
+            pr.reviews.append(review)
+            pr.reviews_by_reviewer[reviewer] = review
+
+        if status is REVIEW_APPROVED:
             pr.approved = True
 
-        status_text = {
-            "approved": "approved these changes",
-            "request_changes": "requested changes",
-            "comment": "commented",
-        }.get(status, status)
+        status_text = REVIEW_STATUS_TEXT.get(status, status)
 
         output = f"{reviewer} {status_text}"
         if comment:
             output += f"\n\n{comment}"
 
         return CommandResult(success=True, output=output)
+
+    def _set_status(self, pr: PullRequest, status: PRStatus) -> None:
+        """Change a PR's status, keeping the status index in sync."""
+        buckets = self.repo.state.prs_by_status
+        buckets[pr.status.value].discard(pr.number)
+        buckets[status.value].add(pr.number)
+        pr.status = status
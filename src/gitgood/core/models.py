@@ -2,8 +2,8 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum
-from typing import Optional
+from enum import Enum, IntEnum
+from typing import Collection, Optional
 
 
 class PRStatus(Enum):
@@ -13,7 +13,22 @@ class PRStatus(Enum):
     CLOSED = "closed"
 
 
-@dataclass
+class ChangeType(IntEnum):
+    """Kind of change recorded for a staged file."""
+    ADDED = 0
+    MODIFIED = 1
+    DELETED = 2
+
+
+CHANGE_TYPE_LABELS = {
+    ChangeType.ADDED: "added",
+    ChangeType.MODIFIED: "modified",
+    ChangeType.DELETED: "deleted",
+}
+CHANGE_TYPES_BY_LABEL = {label: kind for kind, label in CHANGE_TYPE_LABELS.items()}
+
+
+@dataclass(slots=True)
 class Commit:
     """Represents a single commit in the virtual repository."""
     sha: str
@@ -21,7 +36,7 @@ class Commit:
     parent_sha: Optional[str] = None
     timestamp: datetime = field(default_factory=datetime.now)
     author: str = "learner"
-    files_changed: list[str] = field(default_factory=list)
+    files_changed: tuple[str, ...] = ()
 
 
 @dataclass
@@ -33,14 +48,22 @@ class Branch:
     is_remote: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class StagedChange:
     """Represents a file staged for commit."""
     filename: str
-    change_type: str  # "added", "modified", "deleted"
+    change_type: ChangeType
 
 
-@dataclass
+@dataclass(slots=True)
+class Review:
+    """A review (or pending review request) on a pull request."""
+    reviewer: str
+    status: str = "pending"  # "pending", "approved", "request_changes", "comment"
+    comment: str = ""
+
+
+@dataclass(slots=True)
 class PullRequest:
     """Represents a GitHub pull request."""
     number: int
@@ -49,7 +72,8 @@ class PullRequest:
     source_branch: str
     target_branch: str = "main"
     status: PRStatus = PRStatus.OPEN
-    reviews: list[dict] = field(default_factory=list)
+    reviews: list[Review] = field(default_factory=list)
+    reviews_by_reviewer: dict[str, Review] = field(default_factory=dict, repr=False)
     approved: bool = False
     merge_conflicts: bool = False
 
@@ -60,19 +84,29 @@ class RepositoryState:
     commits: dict[str, Commit] = field(default_factory=dict)
     branches: dict[str, Branch] = field(default_factory=dict)
     remote_branches: dict[str, Branch] = field(default_factory=dict)
+    sha_to_branches: dict[str, list[str]] = field(default_factory=dict)
+    sha_to_remote_branches: dict[str, list[str]] = field(default_factory=dict)
+    sorted_branch_names: list[str] = field(default_factory=list)
+    sorted_remote_branch_names: list[str] = field(default_factory=list)
 
     head: str = "main"
     detached_head: bool = False
+    # Bumped whenever a local branch is created or deleted or head moves
+    branch_version: int = 0
 
-    staged_changes: list[StagedChange] = field(default_factory=list)
-    working_changes: list[str] = field(default_factory=list)
+    staged_changes: dict[str, StagedChange] = field(default_factory=dict)
+    working_changes: dict[str, None] = field(default_factory=dict)  # ordered set
 
     remote_url: Optional[str] = None
     pull_requests: dict[int, PullRequest] = field(default_factory=dict)
+    prs_by_status: dict[str, set[int]] = field(
+        default_factory=lambda: {status.value: set() for status in PRStatus}
+    )
+    prs_by_branch: dict[str, list[int]] = field(default_factory=dict)
     next_pr_number: int = 1
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandResult:
     """Result of executing a command."""
     success: bool
@@ -81,12 +115,12 @@ class CommandResult:
     hints: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class RepositoryStatus:
     """Status information about the repository."""
     current_branch: str
     upstream: Optional[str] = None
     ahead: int = 0
     behind: int = 0
-    staged: list[StagedChange] = field(default_factory=list)
-    unstaged: list[str] = field(default_factory=list)
+    staged: Collection[StagedChange] = field(default_factory=list)
+    unstaged: Collection[str] = field(default_factory=list)
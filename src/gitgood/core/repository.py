@@ -1,13 +1,16 @@
 """Virtual git repository simulation."""
 
+import bisect
 import hashlib
-import random
-import string
+import os
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, Optional
 
 from .models import (
+    CHANGE_TYPE_LABELS,
+    CHANGE_TYPES_BY_LABEL,
     Branch,
+    ChangeType,
     Commit,
     CommandResult,
     RepositoryState,
@@ -16,6 +19,26 @@ from .models import (
 )
 
 
+DAY_NAMES = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+MONTH_NAMES = (
+    "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
+)
+DEFAULT_AUTHOR_LINE = "Author: learner"
+# Keys written by export_state; records with exactly these keys map
+# straight onto the dataclass fields
+COMMIT_EXPORT_KEYS = frozenset(("sha", "message", "parent_sha", "files_changed"))
+BRANCH_EXPORT_KEYS = frozenset(("name", "commit_sha", "upstream"))
+# Shared result for a pull that never changes anything; treat as read-only
+UP_TO_DATE_RESULT = CommandResult(success=True, output="Already up to date.")
+PUSH_PRELUDE = (
+    "Enumerating objects: 5, done.\n"
+    "Counting objects: 100% (5/5), done.\n"
+    "Writing objects: 100% (3/3), 298 bytes | 298.00 KiB/s, done.\n"
+    "Total 3 (delta 0), reused 0 (delta 0)"
+)
+
+
 class VirtualRepository:
     """
     Manages the simulated git repository state.
@@ -24,6 +47,13 @@ class VirtualRepository:
 
     def __init__(self):
         self.state = RepositoryState()
+        self._sha_pool = ""
+        self._sha_pos = 0
+        # Fetch result for the remote URL it was built for
+        self._fetch_result: Optional[tuple[Optional[str], CommandResult]] = None
+        # Shared filename strings and file-set tuples for Commit.files_changed
+        self._filename_pool: dict[str, str] = {}
+        self._file_sets: dict[tuple[str, ...], tuple[str, ...]] = {}
         self._initialize_repo()
 
     def _initialize_repo(self) -> None:
@@ -32,20 +62,46 @@ class VirtualRepository:
             sha=self._generate_sha(),
             message="Initial commit",
             parent_sha=None,
-            files_changed=["README.md"],
+            files_changed=self._intern_files(["README.md"]),
         )
         self.state.commits[initial_commit.sha] = initial_commit
         self.state.branches["main"] = Branch(
             name="main",
             commit_sha=initial_commit.sha,
         )
+        self._bind_branch("main", initial_commit.sha)
+        self.state.sorted_branch_names.append("main")
         self.state.head = "main"
         self.state.remote_url = "https://github.com/learner/my-project.git"
 
     def _generate_sha(self) -> str:
         """Generate a random 7-character SHA-like string."""
-        chars = string.ascii_lowercase + string.digits
-        return "".join(random.choices(chars, k=7))
+        pos = self._sha_pos
+        if pos + 7 > len(self._sha_pool):
+            self._sha_pool = os.urandom(2048).hex()
+            pos = 0
+        self._sha_pos = pos + 7
+        return self._sha_pool[pos:pos + 7]
+
+    def _intern_files(self, files: Iterable[str]) -> tuple[str, ...]:
+        """Return a shared tuple for a set of changed filenames."""
+        pool = self._filename_pool
+        key = tuple([pool.setdefault(f, f) for f in files])
+        return self._file_sets.setdefault(key, key)
+
+    def _bind_branch(self, name: str, sha: str, remote: bool = False) -> None:
+        """Record a branch in the commit -> branch names index."""
+        index = self.state.sha_to_remote_branches if remote else self.state.sha_to_branches
+        index.setdefault(sha, []).append(name)
+
+    def _unbind_branch(self, name: str, old_sha: str, remote: bool = False) -> None:
+        """Remove a branch from the commit -> branch names index."""
+        index = self.state.sha_to_remote_branches if remote else self.state.sha_to_branches
+        names = index.get(old_sha)
+        if names and name in names:
+            names.remove(name)
+            if not names:
+                del index[old_sha]
 
     def get_current_branch(self) -> str:
         """Get the name of the current branch."""
@@ -82,6 +138,9 @@ class VirtualRepository:
             base_sha = self.state.branches[self.state.head].commit_sha
 
         self.state.branches[name] = Branch(name=name, commit_sha=base_sha)
+        self._bind_branch(name, base_sha)
+        bisect.insort(self.state.sorted_branch_names, name)
+        self.state.branch_version += 1
         return CommandResult(success=True, message="")
 
     def delete_branch(self, name: str, force: bool = False) -> CommandResult:
@@ -104,7 +163,9 @@ class VirtualRepository:
                 message="error: cannot delete the main branch",
             )
 
-        del self.state.branches[name]
+        self._unbind_branch(name, self.state.branches.pop(name).commit_sha)
+        self.state.sorted_branch_names.remove(name)
+        self.state.branch_version += 1
         return CommandResult(
             success=True,
             output=f"Deleted branch {name}.",
@@ -130,6 +191,7 @@ class VirtualRepository:
             )
 
         self.state.head = target
+        self.state.branch_version += 1
         return CommandResult(
             success=True,
             output=f"Switched to branch '{target}'",
@@ -138,14 +200,14 @@ class VirtualRepository:
     def list_branches(self, all_branches: bool = False) -> CommandResult:
         """List all branches."""
         lines = []
-        for name in sorted(self.state.branches.keys()):
+        for name in self.state.sorted_branch_names:
             if self.state.branches[name].is_remote and not all_branches:
                 continue
             prefix = "* " if name == self.state.head else "  "
             lines.append(f"{prefix}{name}")
 
         if all_branches:
-            for name in sorted(self.state.remote_branches.keys()):
+            for name in self.state.sorted_remote_branch_names:
                 lines.append(f"  remotes/{name}")
 
         return CommandResult(success=True, output="\n".join(lines))
@@ -156,38 +218,32 @@ class VirtualRepository:
         """Stage a file for commit."""
         if filename in (".", "-A", "--all"):
             # Stage all working changes
-            for f in self.state.working_changes:
-                self.state.staged_changes.append(
-                    StagedChange(filename=f, change_type="modified")
-                )
-            self.state.working_changes = []
+            staged = self.state.staged_changes
+            staged.update({
+                f: StagedChange(filename=f, change_type=ChangeType.MODIFIED)
+                for f in self.state.working_changes
+                if f not in staged
+            })
+            self.state.working_changes.clear()
             return CommandResult(success=True, message="")
 
-        # Add specific file
-        change_type = "modified"
-        if filename in self.state.working_changes:
-            self.state.working_changes.remove(filename)
-            change_type = "modified"
-        else:
-            change_type = "added"
-
-        # Check if already staged
-        for change in self.state.staged_changes:
-            if change.filename == filename:
-                return CommandResult(success=True, message="")
+        # Add specific file; anything not already in the working tree is new
+        working = self.state.working_changes
+        change_type = ChangeType.MODIFIED if filename in working else ChangeType.ADDED
+        working.pop(filename, None)
 
-        self.state.staged_changes.append(
-            StagedChange(filename=filename, change_type=change_type)
-        )
+        # An already staged file keeps its original entry
+        if filename not in self.state.staged_changes:
+            self.state.staged_changes[filename] = StagedChange(
+                filename=filename, change_type=change_type
+            )
         return CommandResult(success=True, message="")
 
     def unstage_file(self, filename: str) -> CommandResult:
         """Remove a file from staging."""
-        for i, change in enumerate(self.state.staged_changes):
-            if change.filename == filename:
-                self.state.staged_changes.pop(i)
-                self.state.working_changes.append(filename)
-                return CommandResult(success=True, message="")
+        if self.state.staged_changes.pop(filename, None) is not None:
+            self.state.working_changes[filename] = None
+            return CommandResult(success=True, message="")
 
         return CommandResult(
             success=False,
@@ -208,7 +264,7 @@ class VirtualRepository:
                 hints=["Use 'git add <file>' to stage changes"],
             )
 
-        files = [c.filename for c in self.state.staged_changes]
+        files = self._intern_files(self.state.staged_changes)
         parent_sha = self.state.branches[self.state.head].commit_sha
 
         new_commit = Commit(
@@ -219,8 +275,11 @@ class VirtualRepository:
         )
 
         self.state.commits[new_commit.sha] = new_commit
-        self.state.branches[self.state.head].commit_sha = new_commit.sha
-        self.state.staged_changes = []
+        head_branch = self.state.branches[self.state.head]
+        self._unbind_branch(head_branch.name, head_branch.commit_sha)
+        head_branch.commit_sha = new_commit.sha
+        self._bind_branch(head_branch.name, new_commit.sha)
+        self.state.staged_changes = {}
 
         file_count = len(files)
         file_word = "file" if file_count == 1 else "files"
@@ -232,7 +291,9 @@ class VirtualRepository:
     def get_log(self, count: int = 10, oneline: bool = False) -> CommandResult:
         """Get commit history."""
         lines = []
-        current_sha = self.state.branches[self.state.head].commit_sha
+        head_name = self.state.head
+        head_sha = self.state.branches[head_name].commit_sha
+        current_sha = head_sha
 
         visited = 0
         while current_sha and visited < count:
@@ -240,38 +301,44 @@ class VirtualRepository:
             if not commit:
                 break
 
-            decorations = self._get_decorations(current_sha)
+            decorations = self._get_decorations(current_sha, head_sha, head_name)
             dec_str = f" ({', '.join(decorations)})" if decorations else ""
 
             if oneline:
                 lines.append(f"{commit.sha}{dec_str} {commit.message}")
             else:
-                lines.append(f"commit {commit.sha}{dec_str}")
-                lines.append(f"Author: {commit.author}")
-                lines.append(f"Date:   {commit.timestamp.strftime('%a %b %d %H:%M:%S %Y')}")
-                lines.append("")
-                lines.append(f"    {commit.message}")
-                lines.append("")
+                t = commit.timestamp
+                lines.extend((
+                    f"commit {commit.sha}{dec_str}",
+                    DEFAULT_AUTHOR_LINE
+                    if commit.author == "learner"
+                    else f"Author: {commit.author}",
+                    (
+                        f"Date:   {DAY_NAMES[t.weekday()]} {MONTH_NAMES[t.month - 1]} "
+                        f"{t.day:02d} {t.hour:02d}:{t.minute:02d}:{t.second:02d} {t.year}"
+                    ),
+                    "",
+                    f"    {commit.message}",
+                    "",
+                ))
 
             current_sha = commit.parent_sha
             visited += 1
 
         return CommandResult(success=True, output="\n".join(lines))
 
-    def _get_decorations(self, sha: str) -> list[str]:
+    def _get_decorations(self, sha: str, head_sha: str, head_name: str) -> list[str]:
         """Get branch decorations for a commit."""
         decorations = []
 
-        if self.state.branches[self.state.head].commit_sha == sha:
-            decorations.append(f"HEAD -> {self.state.head}")
+        if head_sha == sha:
+            decorations.append(f"HEAD -> {head_name}")
 
-        for name, branch in self.state.branches.items():
-            if branch.commit_sha == sha and name != self.state.head:
-                decorations.append(name)
-
-        for name, branch in self.state.remote_branches.items():
-            if branch.commit_sha == sha:
-                decorations.append(name)
+        decorations.extend(
+            name for name in self.state.sha_to_branches.get(sha, ()) if name != head_name
+        )
+        if self.state.sha_to_remote_branches:
+            decorations.extend(self.state.sha_to_remote_branches.get(sha, ()))
 
         return decorations
 
@@ -296,6 +363,12 @@ class VirtualRepository:
         remote_name = f"{remote}/{branch_name}"
 
         # Simulate push by creating/updating remote branch
+        existing = self.state.remote_branches.get(remote_name)
+        if existing:
+            self._unbind_branch(remote_name, existing.commit_sha, remote=True)
+        else:
+            bisect.insort(self.state.sorted_remote_branch_names, remote_name)
+        self._bind_branch(remote_name, local_branch.commit_sha, remote=True)
         self.state.remote_branches[remote_name] = Branch(
             name=remote_name,
             commit_sha=local_branch.commit_sha,
@@ -306,10 +379,7 @@ class VirtualRepository:
             local_branch.upstream = remote_name
 
         output_lines = [
-            f"Enumerating objects: 5, done.",
-            f"Counting objects: 100% (5/5), done.",
-            f"Writing objects: 100% (3/3), 298 bytes | 298.00 KiB/s, done.",
-            f"Total 3 (delta 0), reused 0 (delta 0)",
+            PUSH_PRELUDE,
             f"remote: Create a pull request for '{branch_name}' on GitHub by visiting:",
             f"remote:      https://github.com/learner/my-project/pull/new/{branch_name}",
             f"To {self.state.remote_url}",
@@ -318,7 +388,8 @@ class VirtualRepository:
         if remote_name not in self.state.remote_branches:
             output_lines.append(f" * [new branch]      {branch_name} -> {branch_name}")
         else:
-            output_lines.append(f"   {local_branch.commit_sha[:7]}..{local_branch.commit_sha[:7]}  {branch_name} -> {branch_name}")
+            short_sha = local_branch.commit_sha[:7]
+            output_lines.append(f"   {short_sha}..{short_sha}  {branch_name} -> {branch_name}")
 
         if set_upstream:
             output_lines.append(f"branch '{branch_name}' set up to track '{remote_name}'")
@@ -327,26 +398,19 @@ class VirtualRepository:
 
     def pull(self, remote: str = "origin", branch: Optional[str] = None) -> CommandResult:
         """Pull changes from remote."""
-        branch_name = branch or self.state.head
-        remote_name = f"{remote}/{branch_name}"
-
-        if remote_name not in self.state.remote_branches:
-            return CommandResult(
-                success=True,
-                output="Already up to date.",
-            )
-
-        return CommandResult(
-            success=True,
-            output="Already up to date.",
-        )
+        # Nothing else pushes to the simulated remote, so it's always up to date
+        return UP_TO_DATE_RESULT
 
     def fetch(self, remote: str = "origin") -> CommandResult:
         """Fetch from remote."""
-        return CommandResult(
-            success=True,
-            output=f"From {self.state.remote_url}\n * branch            main       -> FETCH_HEAD",
-        )
+        url = self.state.remote_url
+        if self._fetch_result is None or self._fetch_result[0] != url:
+            result = CommandResult(
+                success=True,
+                output=f"From {url}\n * branch            main       -> FETCH_HEAD",
+            )
+            self._fetch_result = (url, result)
+        return self._fetch_result[1]
 
     # Merge operations
 
@@ -372,7 +436,9 @@ class VirtualRepository:
                 files_changed=source_commit.files_changed,
             )
             self.state.commits[merge_commit.sha] = merge_commit
+            self._unbind_branch(target_branch.name, target_branch.commit_sha)
             target_branch.commit_sha = merge_commit.sha
+            self._bind_branch(target_branch.name, merge_commit.sha)
 
         return CommandResult(
             success=True,
@@ -383,6 +449,13 @@ class VirtualRepository:
 
     def status(self) -> RepositoryStatus:
         """Get repository status."""
+        status = self._status_view()
+        status.staged = list(status.staged)
+        status.unstaged = list(status.unstaged)
+        return status
+
+    def _status_view(self) -> RepositoryStatus:
+        """Get repository status backed by live views of the staging state."""
         current_branch = self.state.branches[self.state.head]
         upstream = current_branch.upstream
 
@@ -400,13 +473,13 @@ class VirtualRepository:
             upstream=upstream,
             ahead=ahead,
             behind=behind,
-            staged=list(self.state.staged_changes),
-            unstaged=list(self.state.working_changes),
+            staged=self.state.staged_changes.values(),
+            unstaged=self.state.working_changes.keys(),
         )
 
     def get_status_output(self) -> CommandResult:
         """Get formatted status output."""
-        status = self.status()
+        status = self._status_view()
         lines = [f"On branch {status.current_branch}"]
 
         if status.upstream:
@@ -429,7 +502,8 @@ class VirtualRepository:
             lines.append("Changes to be committed:")
             lines.append('  (use "git restore --staged <file>..." to unstage)')
             for change in status.staged:
-                lines.append(f"        {change.change_type}:   {change.filename}")
+                label = CHANGE_TYPE_LABELS[change.change_type]
+                lines.append(f"        {label}:   {change.filename}")
 
         if status.unstaged:
             lines.append("")
@@ -448,8 +522,11 @@ class VirtualRepository:
 
     def add_working_change(self, filename: str) -> None:
         """Add a simulated file change to working directory."""
-        if filename not in self.state.working_changes:
-            self.state.working_changes.append(filename)
+        self.state.working_changes[filename] = None
+
+    def add_working_changes(self, filenames: Iterable[str]) -> None:
+        """Add several simulated file changes to the working directory at once."""
+        self.state.working_changes.update(dict.fromkeys(filenames))
 
     def export_state(self) -> dict:
         """Export repository state for saving."""
@@ -459,7 +536,7 @@ class VirtualRepository:
                     "sha": c.sha,
                     "message": c.message,
                     "parent_sha": c.parent_sha,
-                    "files_changed": c.files_changed,
+                    "files_changed": list(c.files_changed),
                 }
                 for sha, c in self.state.commits.items()
             },
@@ -469,39 +546,51 @@ class VirtualRepository:
             },
             "head": self.state.head,
             "staged_changes": [
-                {"filename": s.filename, "change_type": s.change_type}
-                for s in self.state.staged_changes
+                {"filename": s.filename, "change_type": CHANGE_TYPE_LABELS[s.change_type]}
+                for s in self.state.staged_changes.values()
             ],
-            "working_changes": self.state.working_changes,
+            "working_changes": list(self.state.working_changes),
         }
 
     def import_state(self, data: dict) -> None:
         """Import repository state."""
         self.state = RepositoryState()
 
-        for sha, commit_data in data.get("commits", {}).items():
-            self.state.commits[sha] = Commit(
-                sha=commit_data["sha"],
-                message=commit_data["message"],
-                parent_sha=commit_data.get("parent_sha"),
-                files_changed=commit_data.get("files_changed", []),
+        self.state.commits = {
+            sha: (
+                Commit(**commit_data)
+                if commit_data.keys() == COMMIT_EXPORT_KEYS
+                else Commit(
+                    sha=commit_data["sha"],
+                    message=commit_data["message"],
+                    parent_sha=commit_data.get("parent_sha"),
+                    files_changed=commit_data.get("files_changed", ()),
+                )
             )
+            for sha, commit_data in data.get("commits", {}).items()
+        }
+        for commit in self.state.commits.values():
+            commit.files_changed = self._intern_files(commit.files_changed)
 
         for name, branch_data in data.get("branches", {}).items():
-            self.state.branches[name] = Branch(
-                name=branch_data["name"],
-                commit_sha=branch_data["commit_sha"],
-                upstream=branch_data.get("upstream"),
-            )
+            if branch_data.keys() == BRANCH_EXPORT_KEYS:
+                branch = Branch(**branch_data)
+            else:
+                branch = Branch(
+                    name=branch_data["name"],
+                    commit_sha=branch_data["commit_sha"],
+                    upstream=branch_data.get("upstream"),
+                )
+            self.state.branches[name] = branch
+            self._bind_branch(name, branch.commit_sha)
+        self.state.sorted_branch_names = sorted(self.state.branches)
 
         self.state.head = data.get("head", "main")
 
         for change_data in data.get("staged_changes", []):
-            self.state.staged_changes.append(
-                StagedChange(
-                    filename=change_data["filename"],
-                    change_type=change_data["change_type"],
-                )
+            self.state.staged_changes[change_data["filename"]] = StagedChange(
+                filename=change_data["filename"],
+                change_type=CHANGE_TYPES_BY_LABEL[change_data["change_type"]],
             )
 
-        self.state.working_changes = data.get("working_changes", [])
+        self.state.working_changes = dict.fromkeys(data.get("working_changes", []))
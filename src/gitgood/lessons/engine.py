@@ -3,6 +3,7 @@
 import re
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from typing import Optional, Callable, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -16,7 +17,26 @@ class StepType(Enum):
     FREE_PRACTICE = "free_practice"  # User can experiment freely
 
 
-@dataclass
+# Compiled command patterns, shared by every step using the same regex
+_PATTERN_CACHE: dict[str, re.Pattern] = {}
+
+
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compile a command pattern once and reuse it across steps."""
+    compiled = _PATTERN_CACHE.get(pattern)
+    if compiled is None:
+        compiled = re.compile(pattern, re.IGNORECASE)
+        _PATTERN_CACHE[pattern] = compiled
+    return compiled
+
+
+@lru_cache(maxsize=1024)
+def _normalize_command(cmd: str) -> str:
+    """Normalize a command for comparison (whitespace, case and quote style)."""
+    return " ".join(cmd.split()).lower().replace("'", '"')
+
+
+@dataclass(slots=True)
 class LessonStep:
     """A single step in a lesson."""
     step_id: str
@@ -34,8 +54,36 @@ class LessonStep:
     # Setup for this step (simulated file changes, etc.)
     setup_changes: list[str] = field(default_factory=list)
 
+    # Precomputed matching data, built once at load time
+    _compiled_pattern: Optional[re.Pattern] = field(default=None, init=False, repr=False)
+    _raw_expected: frozenset[str] = field(default=frozenset(), init=False, repr=False)
+    _normalized_expected: frozenset[str] = field(default=frozenset(), init=False, repr=False)
+    _expected_token_sets: frozenset[frozenset[str]] = field(
+        default=frozenset(), init=False, repr=False
+    )
+    _hint_prefix: Optional[str] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.command_pattern:
+            self._compiled_pattern = _compile_pattern(self.command_pattern)
+
+        self._raw_expected = frozenset(self.expected_commands)
+        normalized = [_normalize_command(cmd) for cmd in self.expected_commands]
+        self._normalized_expected = frozenset(normalized)
+        # Token bags allow flag order variations for git commands
+        self._expected_token_sets = frozenset(
+            frozenset(cmd.split()) for cmd in normalized if cmd.startswith("git ")
+        )
 
-@dataclass
+        # Partial hint revealing the start of the first expected command
+        words = self.expected_commands[0].split() if self.expected_commands else []
+        if len(words) > 2:
+            self._hint_prefix = f"The command starts with: {words[0]} {words[1]} ..."
+        elif words:
+            self._hint_prefix = f"The command starts with: {words[0]} ..."
+
+
+@dataclass(slots=True)
 class Lesson:
     """A complete lesson on a GitHub flow topic."""
     lesson_id: str
@@ -51,7 +99,7 @@ class Lesson:
     initial_state: Optional[dict] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of validating a user command."""
     success: bool
@@ -66,28 +114,49 @@ class LessonEngine:
     def __init__(self, repo: "VirtualRepository"):
         self.repo = repo
         self.lessons: dict[str, Lesson] = {}
+        # Registered lessons not yet loaded, keyed by lesson ID
+        self._lazy_lessons: dict[str, Callable[[], Optional[Lesson]]] = {}
+        # Cached result of get_all_lessons, reset when lessons are added
+        self._ordered_lessons: Optional[list[Lesson]] = None
         self.lesson_order: list[str] = []
         self.current_lesson: Optional[Lesson] = None
         self.current_step_index: int = 0
         self.completed_lessons: set[str] = set()
+        self.last_completed: Optional[str] = None
         self.attempt_count: int = 0
+        # Index into lesson_order before which every lesson is completed
+        self._next_lesson_cursor: int = 0
 
     def add_lesson(self, lesson: Lesson) -> None:
         """Add a lesson to the engine."""
         self.lessons[lesson.lesson_id] = lesson
         self.lesson_order.append(lesson.lesson_id)
+        self._ordered_lessons = None
+
+    def register_lazy(self, lesson_id: str, load: Callable[[], Optional[Lesson]]) -> None:
+        """Register a lesson that is loaded on first access."""
+        self._lazy_lessons[lesson_id] = load
+        self.lesson_order.append(lesson_id)
+        self._ordered_lessons = None
 
     def get_lesson(self, lesson_id: str) -> Optional[Lesson]:
         """Get a lesson by ID."""
-        return self.lessons.get(lesson_id)
+        lesson = self.lessons.get(lesson_id)
+        if lesson is None and lesson_id in self._lazy_lessons:
+            lesson = self._load_lazy(lesson_id)
+        return lesson
 
     def get_all_lessons(self) -> list[Lesson]:
         """Get all lessons in order."""
-        return [self.lessons[lid] for lid in self.lesson_order]
+        if self._ordered_lessons is None:
+            for lesson_id in list(self._lazy_lessons):
+                self._load_lazy(lesson_id)
+            self._ordered_lessons = [self.lessons[lid] for lid in self.lesson_order]
+        return self._ordered_lessons
 
     def start_lesson(self, lesson_id: str) -> Optional[LessonStep]:
         """Begin a lesson, setting up initial state."""
-        lesson = self.lessons.get(lesson_id)
+        lesson = self.get_lesson(lesson_id)
         if not lesson:
             return None
 
@@ -138,21 +207,17 @@ class LessonEngine:
 
         # Command validation
         if step.step_type == StepType.COMMAND:
-            normalized_input = self._normalize_command(user_input)
-
             # Check against expected commands
-            for expected in step.expected_commands:
-                normalized_expected = self._normalize_command(expected)
-                if self._commands_match(normalized_input, normalized_expected):
-                    return ValidationResult(
-                        success=True,
-                        message=step.success_message,
-                        advance=True,
-                    )
+            if self._matches_expected(user_input, step):
+                return ValidationResult(
+                    success=True,
+                    message=step.success_message,
+                    advance=True,
+                )
 
             # Check pattern if specified
-            if step.command_pattern:
-                if re.match(step.command_pattern, user_input, re.IGNORECASE):
+            if step._compiled_pattern:
+                if step._compiled_pattern.match(user_input):
                     return ValidationResult(
                         success=True,
                         message=step.success_message,
@@ -186,9 +251,11 @@ class LessonEngine:
 
     def get_next_lesson(self) -> Optional[Lesson]:
         """Get the next uncompleted lesson."""
-        for lesson_id in self.lesson_order:
+        for lesson_id in self.lesson_order[self._next_lesson_cursor:]:
             if lesson_id not in self.completed_lessons:
-                return self.lessons[lesson_id]
+                lesson = self.get_lesson(lesson_id)
+                if lesson:
+                    return lesson
         return None
 
     def is_lesson_active(self) -> bool:
@@ -215,13 +282,9 @@ class LessonEngine:
             hint_index = min(self.attempt_count - 1, len(step.failure_hints) - 1)
             return step.failure_hints[hint_index]
 
-        if step.expected_commands:
+        if step._hint_prefix:
             # Give a partial hint
-            cmd = step.expected_commands[0]
-            words = cmd.split()
-            if len(words) > 2:
-                return f"The command starts with: {words[0]} {words[1]} ..."
-            return f"The command starts with: {words[0]} ..."
+            return step._hint_prefix
 
         return "Keep trying!"
 
@@ -233,36 +296,56 @@ class LessonEngine:
         """Mark current lesson as complete."""
         if self.current_lesson:
             self.completed_lessons.add(self.current_lesson.lesson_id)
+            self.last_completed = self.current_lesson.lesson_id
             self.current_lesson = None
             self.current_step_index = 0
 
-    def _normalize_command(self, cmd: str) -> str:
-        """Normalize a command for comparison."""
-        # Remove extra whitespace
-        cmd = " ".join(cmd.split())
-        # Lowercase
-        cmd = cmd.lower()
-        return cmd
-
-    def _commands_match(self, input_cmd: str, expected_cmd: str) -> bool:
-        """Check if two commands match (with some flexibility)."""
-        # Exact match
-        if input_cmd == expected_cmd:
-            return True
+            # Skip past the fully completed prefix of the lesson order
+            while (
+                self._next_lesson_cursor < len(self.lesson_order)
+                and self.lesson_order[self._next_lesson_cursor] in self.completed_lessons
+            ):
+                self._next_lesson_cursor += 1
 
-        # Handle quote variations
-        input_cmd = input_cmd.replace("'", '"')
-        expected_cmd = expected_cmd.replace("'", '"')
+    def _load_lazy(self, lesson_id: str) -> Optional[Lesson]:
+        """
+        Load a registered lesson, dropping it from the order if loading fails.
+
+        Lessons are registered under their file name; if the parsed lesson_id
+        differs, the lesson is re-keyed under the real ID so completion
+        tracking matches lesson_order.
+        """
+        lesson = self._lazy_lessons.pop(lesson_id)()
+        index = self.lesson_order.index(lesson_id)
+        if lesson is None or (
+            lesson.lesson_id != lesson_id
+            and (lesson.lesson_id in self.lessons or lesson.lesson_id in self._lazy_lessons)
+        ):
+            # Unloadable, or a duplicate of a lesson already registered
+            del self.lesson_order[index]
+            if index < self._next_lesson_cursor:
+                self._next_lesson_cursor -= 1
+            self._ordered_lessons = None
+            return None
+        if lesson.lesson_id != lesson_id:
+            self.lesson_order[index] = lesson.lesson_id
+            self._ordered_lessons = None
+        self.lessons[lesson.lesson_id] = lesson
+        return lesson
+
+    def _matches_expected(self, user_input: str, step: LessonStep) -> bool:
+        """Check a command against a step's expected commands."""
+        # Verbatim match needs no normalization
+        if user_input in step._raw_expected:
+            return True
 
-        if input_cmd == expected_cmd:
+        normalized_input = _normalize_command(user_input)
+        if normalized_input in step._normalized_expected:
             return True
 
         # Handle flag order variations for git commands
-        if input_cmd.startswith("git ") and expected_cmd.startswith("git "):
-            input_parts = set(input_cmd.split())
-            expected_parts = set(expected_cmd.split())
-            if input_parts == expected_parts:
-                return True
+        if normalized_input.startswith("git "):
+            return frozenset(normalized_input.split()) in step._expected_token_sets
 
         return False
 
@@ -273,7 +356,7 @@ class LessonEngine:
         # Check for common mistakes
         if not user_input:
             hints.append("Please type a command.")
-        elif not user_input.startswith("git") and not user_input.startswith("gh"):
+        elif not user_input.startswith(("git", "gh")):
             hints.append("Git commands start with 'git' or 'gh'.")
         else:
             # Add step-specific hints
@@ -296,5 +379,4 @@ class LessonEngine:
 
     def _apply_step_setup(self, step: LessonStep) -> None:
         """Apply setup changes for a step (e.g., simulate file changes)."""
-        for filename in step.setup_changes:
-            self.repo.add_working_change(filename)
+        self.repo.add_working_changes(step.setup_changes)
@@ -1,20 +1,31 @@
 """Lesson file loader."""
 
+import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Optional
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader
+
 from .engine import Lesson, LessonStep, StepType, LessonEngine
 
 
-def load_lesson_from_yaml(filepath: str) -> Optional[Lesson]:
-    """Load a lesson from a YAML file."""
+def load_lesson_from_file(filepath: str) -> Optional[Lesson]:
+    """Load a lesson from a JSON or YAML file."""
     try:
         with open(filepath, "r") as f:
-            data = yaml.safe_load(f)
-    except (OSError, yaml.YAMLError) as e:
+            if filepath.endswith(".json"):
+                data = json.load(f)
+            else:
+                data = yaml.load(f, Loader=YamlLoader)
+    except (OSError, ValueError, yaml.YAMLError) as e:
         print(f"Error loading lesson from {filepath}: {e}")
         return None
 
@@ -51,19 +62,37 @@ def load_lesson_from_yaml(filepath: str) -> Optional[Lesson]:
     return lesson
 
 
-def load_lessons_from_directory(directory: str, engine: LessonEngine) -> int:
-    """Load all lessons from a directory into the engine."""
+def load_lessons_from_directory(
+    directory: str, engine: LessonEngine, lazy: bool = False
+) -> int:
+    """
+    Load all lessons from a directory into the engine.
+
+    With lazy=True, lessons are only registered by file name and parsed the
+    first time the engine needs them; the return value is then the number of
+    lesson files found, since none have been parsed yet.
+    """
     count = 0
     lesson_dir = Path(directory)
 
     if not lesson_dir.exists():
         return 0
 
-    # Sort files to ensure consistent order
-    yaml_files = sorted(lesson_dir.glob("*.yaml"))
+    lesson_files = _find_lesson_files(lesson_dir)
+    if not lesson_files:
+        return 0
+
+    if lazy:
+        for path in lesson_files:
+            engine.register_lazy(path.stem, partial(load_lesson_from_file, str(path)))
+        return len(lesson_files)
+
+    # Files are independent, so read and parse them concurrently;
+    # map() yields results in file order, keeping lesson order stable
+    with ThreadPoolExecutor(max_workers=min(8, len(lesson_files))) as pool:
+        lessons = list(pool.map(load_lesson_from_file, map(str, lesson_files)))
 
-    for filepath in yaml_files:
-        lesson = load_lesson_from_yaml(str(filepath))
+    for lesson in lessons:
         if lesson:
             engine.add_lesson(lesson)
             count += 1
@@ -71,6 +100,31 @@ def load_lessons_from_directory(directory: str, engine: LessonEngine) -> int:
     return count
 
 
+def export_lessons_to_json(directory: str) -> int:
+    """
+    Write a JSON copy next to each YAML lesson in a directory.
+
+    JSON copies load faster and take precedence over their YAML source,
+    so re-run this after editing lesson YAML.
+    """
+    count = 0
+    for yaml_path in sorted(Path(directory).glob("*.yaml")):
+        with open(yaml_path, "r") as f:
+            data = yaml.load(f, Loader=YamlLoader)
+        with open(yaml_path.with_suffix(".json"), "w") as f:
+            json.dump(data, f, indent=2)
+        count += 1
+    return count
+
+
+def _find_lesson_files(lesson_dir: Path) -> list[Path]:
+    """List lesson files sorted by name, preferring JSON copies over YAML."""
+    files = {path.stem: path for path in lesson_dir.glob("*.yaml")}
+    files.update((path.stem, path) for path in lesson_dir.glob("*.json"))
+    return [files[stem] for stem in sorted(files)]
+
+
+@lru_cache(maxsize=1)
 def get_default_lessons_dir() -> str:
     """Get the path to the default lessons directory."""
     # Look relative to this file
@@ -1,19 +1,44 @@
 """Supported command definitions."""
 
+import sys
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Any, Callable, Optional
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CommandSpec:
     """Specification for a parseable command."""
     name: str
     description: str
     usage: str
     subcommand: Optional[str] = None
-    required_args: list[str] = field(default_factory=list)
-    optional_args: list[str] = field(default_factory=list)
+    required_args: tuple[str, ...] = ()
+    optional_args: tuple[str, ...] = ()
     flags: dict[str, str] = field(default_factory=dict)
+    # Interned flag names as a set, for lexer classification
+    flag_set: frozenset[str] = field(init=False, repr=False)
+    # Formatted help output, built once
+    help_text: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "flag_set", frozenset(map(sys.intern, self.flags)))
+        object.__setattr__(self, "help_text", self._format_help())
+
+    def _format_help(self) -> str:
+        """Format the help text for this command."""
+        lines = [
+            f"{self.description}",
+            "",
+            f"Usage: {self.usage}",
+        ]
+
+        if self.flags:
+            lines.append("")
+            lines.append("Flags:")
+            for flag, desc in self.flags.items():
+                lines.append(f"  {flag:20} {desc}")
+
+        return "\n".join(lines)
 
 
 # Git commands supported by the simulator
@@ -32,7 +57,7 @@ GIT_COMMANDS = {
         name="add",
         description="Add file contents to the index (staging area)",
         usage="git add <file>... | git add . | git add -A",
-        required_args=["files"],
+        required_args=("files",),
         flags={
             "-A": "Add all changes",
             "--all": "Add all changes",
@@ -52,7 +77,7 @@ GIT_COMMANDS = {
         name="branch",
         description="List, create, or delete branches",
         usage="git branch [<name>] | git branch -d <name>",
-        optional_args=["name"],
+        optional_args=("name",),
         flags={
             "-d": "Delete a branch",
             "-D": "Force delete a branch",
@@ -64,7 +89,7 @@ GIT_COMMANDS = {
         name="checkout",
         description="Switch branches or restore working tree files",
         usage="git checkout <branch> | git checkout -b <new-branch>",
-        optional_args=["target"],
+        optional_args=("target",),
         flags={
             "-b": "Create and switch to a new branch",
             "--branch": "Create and switch to a new branch",
@@ -74,7 +99,7 @@ GIT_COMMANDS = {
         name="switch",
         description="Switch branches (modern alternative to checkout)",
         usage="git switch <branch> | git switch -c <new-branch>",
-        optional_args=["target"],
+        optional_args=("target",),
         flags={
             "-c": "Create and switch to a new branch",
             "--create": "Create and switch to a new branch",
@@ -84,7 +109,7 @@ GIT_COMMANDS = {
         name="merge",
         description="Join two or more development histories together",
         usage="git merge <branch>",
-        required_args=["branch"],
+        required_args=("branch",),
         flags={
             "--no-ff": "Create a merge commit even for fast-forward",
         },
@@ -102,7 +127,7 @@ GIT_COMMANDS = {
         name="push",
         description="Update remote refs along with associated objects",
         usage="git push [-u] [<remote>] [<branch>]",
-        optional_args=["remote", "branch"],
+        optional_args=("remote", "branch"),
         flags={
             "-u": "Set upstream tracking reference",
             "--set-upstream": "Set upstream tracking reference",
@@ -112,13 +137,13 @@ GIT_COMMANDS = {
         name="pull",
         description="Fetch from and integrate with another repository",
         usage="git pull [<remote>] [<branch>]",
-        optional_args=["remote", "branch"],
+        optional_args=("remote", "branch"),
     ),
     "fetch": CommandSpec(
         name="fetch",
         description="Download objects and refs from another repository",
         usage="git fetch [<remote>]",
-        optional_args=["remote"],
+        optional_args=("remote",),
     ),
     "remote": CommandSpec(
         name="remote",
@@ -141,7 +166,7 @@ GIT_COMMANDS = {
         name="reset",
         description="Reset current HEAD to the specified state",
         usage="git reset [<file>] | git reset --hard",
-        optional_args=["file"],
+        optional_args=("file",),
         flags={
             "--hard": "Reset working directory and staging area",
             "--soft": "Reset only HEAD pointer",
@@ -178,7 +203,7 @@ GH_COMMANDS = {
         subcommand="merge",
         description="Merge a pull request",
         usage="gh pr merge [<number>] [--merge|--squash|--rebase]",
-        optional_args=["number"],
+        optional_args=("number",),
         flags={
             "--merge": "Use merge commit",
             "--squash": "Squash commits before merging",
@@ -190,38 +215,74 @@ GH_COMMANDS = {
         subcommand="close",
         description="Close a pull request",
         usage="gh pr close <number>",
-        required_args=["number"],
+        required_args=("number",),
     ),
     ("pr", "view"): CommandSpec(
         name="pr",
         subcommand="view",
         description="View a pull request",
         usage="gh pr view [<number>]",
-        optional_args=["number"],
+        optional_args=("number",),
     ),
 }
 
 
+# One bit per flag whose presence handlers test (aliases get separate bits
+# because their meaning differs between commands, e.g. "-a")
+FLAG_BITS = {
+    flag: 1 << bit
+    for bit, flag in enumerate((
+        "-A", "--all", "-a", "-d", "-D", "-b", "--branch", "-c", "--create",
+        "--no-ff", "--oneline", "-u", "--set-upstream", "--staged", "--cached",
+        "-v", "--squash", "--rebase",
+    ))
+}
+
+
+def flag_mask(*flags: str) -> int:
+    """Combine flags into a mask for testing against ParsedCommand.flag_mask."""
+    mask = 0
+    for flag in flags:
+        mask |= FLAG_BITS[flag]
+    return mask
+
+
+# GH_COMMANDS keyed by "command subcommand", so lookups need no tuple key
+GH_COMMANDS_FLAT = {
+    sys.intern(f"{command} {subcommand}"): spec
+    for (command, subcommand), spec in GH_COMMANDS.items()
+}
+
+
+def parse_int(value: str) -> Optional[int]:
+    """Parse a non-negative integer argument, or return None if invalid."""
+    return int(value) if value.isdecimal() else None
+
+
+# Positional arguments the lexer converts to typed values, keyed by
+# (command, subcommand): a (name, converter) pair per position, where
+# converters return None for invalid input
+ARG_SCHEMA: dict[tuple[str, Optional[str]], tuple[tuple[str, Callable[[str], Any]], ...]] = {
+    ("pr", "merge"): (("pr_number", parse_int),),
+    ("pr", "close"): (("pr_number", parse_int),),
+    ("pr", "view"): (("pr_number", parse_int),),
+}
+
+
+def get_command_spec(
+    cmd_type: str, command: str, subcommand: Optional[str] = None
+) -> Optional[CommandSpec]:
+    """Look up the spec for a git or gh command."""
+    if cmd_type == "git":
+        return GIT_COMMANDS.get(command)
+    return GH_COMMANDS_FLAT.get(f"{command} {subcommand}")
+
+
 def get_command_help(cmd_type: str, command: str, subcommand: str = None) -> str:
     """Get help text for a command."""
-    if cmd_type == "git":
-        spec = GIT_COMMANDS.get(command)
-    else:
-        spec = GH_COMMANDS.get((command, subcommand))
+    spec = get_command_spec(cmd_type, command, subcommand)
 
     if not spec:
         return f"Unknown command: {command}"
 
-    lines = [
-        f"{spec.description}",
-        "",
-        f"Usage: {spec.usage}",
-    ]
-
-    if spec.flags:
-        lines.append("")
-        lines.append("Flags:")
-        for flag, desc in spec.flags.items():
-            lines.append(f"  {flag:20} {desc}")
-
-    return "\n".join(lines)
+    return spec.help_text
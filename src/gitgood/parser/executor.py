@@ -1,29 +1,206 @@
 """Command execution and routing."""
 
-from typing import Optional
+from typing import Callable, ClassVar, Optional
 
-from ..core.models import CommandResult
+from ..core.models import CommandResult, PRStatus
 from ..core.repository import VirtualRepository
 from ..core.github_api import SimulatedGitHub
-from .lexer import ParsedCommand, ParseError
-from .commands import GIT_COMMANDS, GH_COMMANDS, get_command_help
+from .lexer import ParsedCommand
+from .commands import GIT_COMMANDS, flag_mask, get_command_help, parse_int
+
+
+GENERAL_HELP = """
+GitHub Flow Learning Tool - Available Commands
+
+Git Commands:
+  git status              Show working tree status
+  git add <file>          Stage files for commit
+  git commit -m 'msg'     Create a commit
+  git branch              List branches
+  git checkout -b <name>  Create and switch to branch
+  git checkout <branch>   Switch to existing branch
+  git push -u origin <b>  Push branch to remote
+  git pull                Pull changes from remote
+  git merge <branch>      Merge a branch
+  git log                 Show commit history
+
+GitHub CLI:
+  gh pr create            Create a pull request
+  gh pr list              List pull requests
+  gh pr merge             Merge a pull request
+  gh pr view              View pull request details
+
+App Commands:
+  help [command]          Show help for a command
+  lesson                  Show current lesson
+  lessons                 List all lessons
+  hint                    Get a hint for current step
+  quit                    Exit the application
+""".strip()
+
+# Simulated diff output for a single changed file
+DIFF_TEMPLATE = (
+    "diff --git a/{f} b/{f}\n"
+    "--- a/{f}\n"
+    "+++ b/{f}\n"
+    "@@ -1,1 +1,1 @@\n"
+    "+simulated change"
+)
+
+# Flag masks tested by the handlers below
+ADD_ALL = flag_mask("-A", "--all")
+COMMIT_ALL = flag_mask("-a")
+BRANCH_DELETE = flag_mask("-d", "-D")
+BRANCH_FORCE_DELETE = flag_mask("-D")
+BRANCH_LIST_ALL = flag_mask("-a", "--all")
+CHECKOUT_CREATE = flag_mask("-b", "--branch")
+SWITCH_CREATE = flag_mask("-c", "--create")
+MERGE_NO_FF = flag_mask("--no-ff")
+LOG_ONELINE = flag_mask("--oneline")
+PUSH_SET_UPSTREAM = flag_mask("-u", "--set-upstream")
+DIFF_STAGED = flag_mask("--staged", "--cached")
+REMOTE_VERBOSE = flag_mask("-v")
+PR_MERGE_SQUASH = flag_mask("--squash")
+PR_MERGE_REBASE = flag_mask("--rebase")
+
+# Shared results for responses that never vary; treat them as read-only
+OK_RESULT = CommandResult(success=True, message="")
+EMPTY_OUTPUT_RESULT = CommandResult(success=True, output="")
+EXIT_RESULT = CommandResult(success=True, message="__EXIT__")
+HELP_RESULT = CommandResult(success=True, output=GENERAL_HELP)
+ERR_NOTHING_ADDED = CommandResult(
+    success=False,
+    message="Nothing specified, nothing added.",
+    hints=["Use 'git add <file>' or 'git add .' to stage files"],
+)
+ERR_COMMIT_NO_MESSAGE = CommandResult(
+    success=False,
+    message="error: switch 'm' requires a value",
+    hints=["Usage: git commit -m 'Your commit message'"],
+)
+ERR_BRANCH_NAME_REQUIRED = CommandResult(
+    success=False,
+    message="error: branch name required",
+)
+ERR_CHECKOUT_NO_VALUE = CommandResult(
+    success=False,
+    message="error: switch 'b' requires a value",
+    hints=["Usage: git checkout -b <branch-name>"],
+)
+ERR_CHECKOUT_NO_TARGET = CommandResult(
+    success=False,
+    message="error: you must specify a branch to checkout",
+    hints=["Usage: git checkout <branch-name>"],
+)
+ERR_SWITCH_NO_VALUE = CommandResult(
+    success=False,
+    message="error: switch 'c' requires a value",
+    hints=["Usage: git switch -c <branch-name>"],
+)
+ERR_SWITCH_NO_TARGET = CommandResult(
+    success=False,
+    message="error: missing branch name",
+)
+ERR_MERGE_NO_BRANCH = CommandResult(
+    success=False,
+    message="error: specify a branch to merge",
+)
+REMOTE_RESULT = CommandResult(success=True, output="origin")
+ERR_PR_NO_TITLE = CommandResult(
+    success=False,
+    message="error: --title is required",
+    hints=["Usage: gh pr create --title 'PR Title' --body 'Description'"],
+)
+ERR_NO_OPEN_PR = CommandResult(
+    success=False,
+    message="error: no open pull request for current branch",
+)
+ERR_INVALID_PR_NUMBER = CommandResult(
+    success=False,
+    message="error: invalid PR number",
+)
+ERR_PR_NUMBER_REQUIRED = CommandResult(
+    success=False,
+    message="error: PR number required",
+)
+ERR_NO_PR_FOR_BRANCH = CommandResult(
+    success=False,
+    message="no pull request found for current branch",
+)
 
 
 class CommandExecutor:
     """Routes parsed commands to the appropriate simulator methods."""
 
+    # Handler method names, keyed by ParsedCommand.command_type
+    COMMAND_TYPE_HANDLERS: ClassVar[dict[str, str]] = {
+        "internal": "_handle_internal",
+        "git": "_handle_git",
+        "gh": "_handle_gh",
+    }
+
+    # Handler method names for internal commands the executor answers itself
+    INTERNAL_HANDLERS: ClassVar[dict[str, str]] = {
+        "help": "_internal_help",
+        "quit": "_internal_exit",
+        "exit": "_internal_exit",
+    }
+
+    # Handler method names, keyed by git command / gh pr subcommand
+    GIT_HANDLERS: ClassVar[dict[str, str]] = {
+        "status": "_git_status",
+        "add": "_git_add",
+        "commit": "_git_commit",
+        "branch": "_git_branch",
+        "checkout": "_git_checkout",
+        "switch": "_git_switch",
+        "merge": "_git_merge",
+        "log": "_git_log",
+        "push": "_git_push",
+        "pull": "_git_pull",
+        "fetch": "_git_fetch",
+        "diff": "_git_diff",
+        "remote": "_git_remote",
+    }
+
+    GH_PR_HANDLERS: ClassVar[dict[str, str]] = {
+        "create": "_gh_pr_create",
+        "list": "_gh_pr_list",
+        "merge": "_gh_pr_merge",
+        "close": "_gh_pr_close",
+        "view": "_gh_pr_view",
+    }
+
     def __init__(self, repo: VirtualRepository, github: SimulatedGitHub):
         self.repo = repo
         self.github = github
 
+        # Bound handlers for every supported (type, command, subcommand),
+        # resolved once so known commands skip the two-level dispatch
+        self._fast_paths: dict[
+            tuple[str, str, Optional[str]], Callable[[ParsedCommand], CommandResult]
+        ] = {
+            ("git", command, None): getattr(self, name)
+            for command, name in self.GIT_HANDLERS.items()
+        }
+        self._fast_paths.update(
+            (("gh", "pr", subcommand), getattr(self, name))
+            for subcommand, name in self.GH_PR_HANDLERS.items()
+        )
+        self._fast_paths.update(
+            (("internal", command, None), getattr(self, name))
+            for command, name in self.INTERNAL_HANDLERS.items()
+        )
+
     def execute(self, cmd: ParsedCommand) -> CommandResult:
         """Execute a parsed command and return the result."""
-        if cmd.command_type == "internal":
-            return self._handle_internal(cmd)
-        elif cmd.command_type == "git":
-            return self._handle_git(cmd)
-        elif cmd.command_type == "gh":
-            return self._handle_gh(cmd)
+        handler = self._fast_paths.get((cmd.command_type, cmd.command, cmd.subcommand))
+        if handler:
+            return handler(cmd)
+
+        handler_name = self.COMMAND_TYPE_HANDLERS.get(cmd.command_type)
+        if handler_name:
+            return getattr(self, handler_name)(cmd)
 
         return CommandResult(
             success=False,
@@ -32,48 +209,30 @@ class CommandExecutor:
 
     def _handle_internal(self, cmd: ParsedCommand) -> CommandResult:
         """Handle internal commands."""
-        if cmd.command == "help":
-            if cmd.args:
-                return CommandResult(
-                    success=True,
-                    output=get_command_help("git", cmd.args[0]),
-                )
-            return CommandResult(
-                success=True,
-                output=self._get_general_help(),
-            )
-
-        if cmd.command in ("quit", "exit"):
-            return CommandResult(
-                success=True,
-                message="__EXIT__",
-            )
+        handler_name = self.INTERNAL_HANDLERS.get(cmd.command)
+        if handler_name:
+            return getattr(self, handler_name)(cmd)
 
         return CommandResult(
             success=True,
             message=f"Internal command: {cmd.command}",
         )
 
+    def _internal_help(self, cmd: ParsedCommand) -> CommandResult:
+        if cmd.args:
+            return CommandResult(
+                success=True,
+                output=get_command_help("git", cmd.args[0]),
+            )
+        return HELP_RESULT
+
+    def _internal_exit(self, cmd: ParsedCommand) -> CommandResult:
+        return EXIT_RESULT
+
     def _handle_git(self, cmd: ParsedCommand) -> CommandResult:
         """Handle git commands."""
-        handlers = {
-            "status": self._git_status,
-            "add": self._git_add,
-            "commit": self._git_commit,
-            "branch": self._git_branch,
-            "checkout": self._git_checkout,
-            "switch": self._git_switch,
-            "merge": self._git_merge,
-            "log": self._git_log,
-            "push": self._git_push,
-            "pull": self._git_pull,
-            "fetch": self._git_fetch,
-            "diff": self._git_diff,
-            "remote": self._git_remote,
-        }
-
-        handler = handlers.get(cmd.command)
-        if not handler:
+        handler_name = self.GIT_HANDLERS.get(cmd.command)
+        if not handler_name:
             if cmd.command in GIT_COMMANDS:
                 return CommandResult(
                     success=False,
@@ -85,7 +244,7 @@ class CommandExecutor:
                 hints=["Type 'help' to see available commands"],
             )
 
-        return handler(cmd)
+        return getattr(self, handler_name)(cmd)
 
     def _handle_gh(self, cmd: ParsedCommand) -> CommandResult:
         """Handle GitHub CLI commands."""
@@ -95,23 +254,15 @@ class CommandExecutor:
                 message=f"gh: '{cmd.command}' is not supported. Only 'gh pr' commands are available.",
             )
 
-        handlers = {
-            "create": self._gh_pr_create,
-            "list": self._gh_pr_list,
-            "merge": self._gh_pr_merge,
-            "close": self._gh_pr_close,
-            "view": self._gh_pr_view,
-        }
-
-        handler = handlers.get(cmd.subcommand)
-        if not handler:
+        handler_name = self.GH_PR_HANDLERS.get(cmd.subcommand)
+        if not handler_name:
             return CommandResult(
                 success=False,
                 message=f"gh pr: '{cmd.subcommand}' is not a valid subcommand",
                 hints=["Available: create, list, merge, close, view"],
             )
 
-        return handler(cmd)
+        return getattr(self, handler_name)(cmd)
 
     # Git command handlers
 
@@ -119,57 +270,46 @@ class CommandExecutor:
         return self.repo.get_status_output()
 
     def _git_add(self, cmd: ParsedCommand) -> CommandResult:
-        if "-A" in cmd.flags or "--all" in cmd.flags:
+        if cmd.flag_mask & ADD_ALL:
             return self.repo.add_file("-A")
 
         if not cmd.args:
-            return CommandResult(
-                success=False,
-                message="Nothing specified, nothing added.",
-                hints=["Use 'git add <file>' or 'git add .' to stage files"],
-            )
+            return ERR_NOTHING_ADDED
 
         for filename in cmd.args:
             result = self.repo.add_file(filename)
             if not result.success:
                 return result
 
-        return CommandResult(success=True, message="")
+        return OK_RESULT
 
     def _git_commit(self, cmd: ParsedCommand) -> CommandResult:
         message = cmd.flags.get("-m") or cmd.flags.get("--message")
         if not message:
-            return CommandResult(
-                success=False,
-                message="error: switch 'm' requires a value",
-                hints=["Usage: git commit -m 'Your commit message'"],
-            )
+            return ERR_COMMIT_NO_MESSAGE
 
-        add_all = "-a" in cmd.flags
+        add_all = bool(cmd.flag_mask & COMMIT_ALL)
         return self.repo.commit(message, add_all=add_all)
 
     def _git_branch(self, cmd: ParsedCommand) -> CommandResult:
         # Delete branch
-        if "-d" in cmd.flags or "-D" in cmd.flags:
+        if cmd.flag_mask & BRANCH_DELETE:
             branch_name = cmd.flags.get("-d") or cmd.flags.get("-D") or (cmd.args[0] if cmd.args else None)
             if not branch_name:
-                return CommandResult(
-                    success=False,
-                    message="error: branch name required",
-                )
-            force = "-D" in cmd.flags
+                return ERR_BRANCH_NAME_REQUIRED
+            force = bool(cmd.flag_mask & BRANCH_FORCE_DELETE)
             return self.repo.delete_branch(branch_name, force=force)
 
         # List branches
         if not cmd.args:
-            all_branches = "-a" in cmd.flags or "--all" in cmd.flags
+            all_branches = bool(cmd.flag_mask & BRANCH_LIST_ALL)
             return self.repo.list_branches(all_branches=all_branches)
 
         # Create branch
         return self.repo.create_branch(cmd.args[0])
 
     def _git_checkout(self, cmd: ParsedCommand) -> CommandResult:
-        create = "-b" in cmd.flags or "--branch" in cmd.flags
+        create = cmd.flag_mask & CHECKOUT_CREATE
 
         if create:
             branch_name = cmd.flags.get("-b") or cmd.flags.get("--branch")
@@ -177,24 +317,16 @@ class CommandExecutor:
                 branch_name = cmd.args[0]
 
             if not branch_name:
-                return CommandResult(
-                    success=False,
-                    message="error: switch 'b' requires a value",
-                    hints=["Usage: git checkout -b <branch-name>"],
-                )
+                return ERR_CHECKOUT_NO_VALUE
             return self.repo.checkout(branch_name, create=True)
 
         if not cmd.args:
-            return CommandResult(
-                success=False,
-                message="error: you must specify a branch to checkout",
-                hints=["Usage: git checkout <branch-name>"],
-            )
+            return ERR_CHECKOUT_NO_TARGET
 
         return self.repo.checkout(cmd.args[0])
 
     def _git_switch(self, cmd: ParsedCommand) -> CommandResult:
-        create = "-c" in cmd.flags or "--create" in cmd.flags
+        create = cmd.flag_mask & SWITCH_CREATE
 
         if create:
             branch_name = cmd.flags.get("-c") or cmd.flags.get("--create")
@@ -202,65 +334,41 @@ class CommandExecutor:
                 branch_name = cmd.args[0]
 
             if not branch_name:
-                return CommandResult(
-                    success=False,
-                    message="error: switch 'c' requires a value",
-                    hints=["Usage: git switch -c <branch-name>"],
-                )
+                return ERR_SWITCH_NO_VALUE
             return self.repo.checkout(branch_name, create=True)
 
         if not cmd.args:
-            return CommandResult(
-                success=False,
-                message="error: missing branch name",
-            )
+            return ERR_SWITCH_NO_TARGET
 
         return self.repo.checkout(cmd.args[0])
 
     def _git_merge(self, cmd: ParsedCommand) -> CommandResult:
         if not cmd.args:
-            return CommandResult(
-                success=False,
-                message="error: specify a branch to merge",
-            )
+            return ERR_MERGE_NO_BRANCH
 
-        no_ff = "--no-ff" in cmd.flags
+        no_ff = bool(cmd.flag_mask & MERGE_NO_FF)
         return self.repo.merge(cmd.args[0], no_ff=no_ff)
 
     def _git_log(self, cmd: ParsedCommand) -> CommandResult:
-        oneline = "--oneline" in cmd.flags
-        count = 10
-
-        if "-n" in cmd.flags and cmd.flags["-n"]:
-            try:
-                count = int(cmd.flags["-n"])
-            except ValueError:
-                pass
+        oneline = bool(cmd.flag_mask & LOG_ONELINE)
+        count = parse_int(cmd.flags.get("-n") or "")
+        if count is None:
+            count = 10
 
         return self.repo.get_log(count=count, oneline=oneline)
 
     def _git_push(self, cmd: ParsedCommand) -> CommandResult:
-        remote = "origin"
-        branch = None
-        set_upstream = "-u" in cmd.flags or "--set-upstream" in cmd.flags
-
-        # Handle -u flag potentially consuming the remote name as its value
-        # -u/--set-upstream is a boolean flag, so any value it has is actually the remote
-        if set_upstream:
-            flag_value = cmd.flags.get("-u") or cmd.flags.get("--set-upstream")
-            if flag_value:
-                # The flag consumed what should be the remote name
-                remote = flag_value
-                if cmd.args:
-                    branch = cmd.args[0]
-            elif cmd.args:
-                remote = cmd.args[0]
-                if len(cmd.args) > 1:
-                    branch = cmd.args[1]
-        elif cmd.args:
-            remote = cmd.args[0]
-            if len(cmd.args) > 1:
-                branch = cmd.args[1]
+        set_upstream = bool(cmd.flag_mask & PUSH_SET_UPSTREAM)
+
+        # -u/--set-upstream is a boolean flag, so any value the lexer gave it
+        # is actually the remote name: treat it as the first positional arg
+        positional = cmd.args
+        flag_value = cmd.flags.get("-u") or cmd.flags.get("--set-upstream")
+        if flag_value:
+            positional = (flag_value, *cmd.args)
+
+        remote = positional[0] if positional else "origin"
+        branch = positional[1] if len(positional) > 1 else None
 
         return self.repo.push(remote=remote, branch=branch, set_upstream=set_upstream)
 
@@ -274,44 +382,35 @@ class CommandExecutor:
         return self.repo.fetch(remote=remote)
 
     def _git_diff(self, cmd: ParsedCommand) -> CommandResult:
-        staged = "--staged" in cmd.flags or "--cached" in cmd.flags
+        staged = cmd.flag_mask & DIFF_STAGED
 
         if staged:
             if self.repo.state.staged_changes:
-                lines = []
-                for change in self.repo.state.staged_changes:
-                    lines.append(f"diff --git a/{change.filename} b/{change.filename}")
-                    lines.append(f"--- a/{change.filename}")
-                    lines.append(f"+++ b/{change.filename}")
-                    lines.append("@@ -1,1 +1,1 @@")
-                    lines.append("+simulated change")
-                return CommandResult(success=True, output="\n".join(lines))
-            return CommandResult(success=True, output="")
+                output = "\n".join(
+                    DIFF_TEMPLATE.format(f=filename)
+                    for filename in self.repo.state.staged_changes
+                )
+                return CommandResult(success=True, output=output)
+            return EMPTY_OUTPUT_RESULT
 
         if self.repo.state.working_changes:
-            lines = []
-            for filename in self.repo.state.working_changes:
-                lines.append(f"diff --git a/{filename} b/{filename}")
-                lines.append(f"--- a/{filename}")
-                lines.append(f"+++ b/{filename}")
-                lines.append("@@ -1,1 +1,1 @@")
-                lines.append("+simulated change")
-            return CommandResult(success=True, output="\n".join(lines))
+            output = "\n".join(
+                DIFF_TEMPLATE.format(f=filename)
+                for filename in self.repo.state.working_changes
+            )
+            return CommandResult(success=True, output=output)
 
-        return CommandResult(success=True, output="")
+        return EMPTY_OUTPUT_RESULT
 
     def _git_remote(self, cmd: ParsedCommand) -> CommandResult:
-        if "-v" in cmd.flags:
+        if cmd.flag_mask & REMOTE_VERBOSE:
             url = self.repo.state.remote_url or "https://github.com/learner/my-project.git"
             return CommandResult(
                 success=True,
                 output=f"origin  {url} (fetch)\norigin  {url} (push)",
             )
 
-        return CommandResult(
-            success=True,
-            output="origin",
-        )
+        return REMOTE_RESULT
 
     # GitHub CLI handlers
 
@@ -321,11 +420,7 @@ class CommandExecutor:
         base = cmd.flags.get("--base") or "main"
 
         if not title:
-            return CommandResult(
-                success=False,
-                message="error: --title is required",
-                hints=["Usage: gh pr create --title 'PR Title' --body 'Description'"],
-            )
+            return ERR_PR_NO_TITLE
 
         return self.github.create_pull_request(
             title=title,
@@ -340,71 +435,47 @@ class CommandExecutor:
     def _gh_pr_merge(self, cmd: ParsedCommand) -> CommandResult:
         if not cmd.args:
             # Find open PR for current branch
-            current = self.repo.state.head
-            for pr in self.repo.state.pull_requests.values():
-                if pr.source_branch == current and pr.status.value == "open":
-                    pr_number = pr.number
+            state = self.repo.state
+            for pr_number in state.prs_by_branch.get(state.head, ()):
+                if state.pull_requests[pr_number].status is PRStatus.OPEN:
                     break
             else:
-                return CommandResult(
-                    success=False,
-                    message="error: no open pull request for current branch",
-                )
+                return ERR_NO_OPEN_PR
         else:
-            try:
-                pr_number = int(cmd.args[0])
-            except ValueError:
-                return CommandResult(
-                    success=False,
-                    message="error: invalid PR number",
-                )
+            pr_number = cmd.typed.get("pr_number")
+            if pr_number is None:
+                return ERR_INVALID_PR_NUMBER
 
         method = "merge"
-        if "--squash" in cmd.flags:
+        if cmd.flag_mask & PR_MERGE_SQUASH:
             method = "squash"
-        elif "--rebase" in cmd.flags:
+        elif cmd.flag_mask & PR_MERGE_REBASE:
             method = "rebase"
 
         return self.github.merge_pull_request(pr_number, method=method)
 
     def _gh_pr_close(self, cmd: ParsedCommand) -> CommandResult:
         if not cmd.args:
-            return CommandResult(
-                success=False,
-                message="error: PR number required",
-            )
+            return ERR_PR_NUMBER_REQUIRED
 
-        try:
-            pr_number = int(cmd.args[0])
-        except ValueError:
-            return CommandResult(
-                success=False,
-                message="error: invalid PR number",
-            )
+        pr_number = cmd.typed.get("pr_number")
+        if pr_number is None:
+            return ERR_INVALID_PR_NUMBER
 
         return self.github.close_pull_request(pr_number)
 
     def _gh_pr_view(self, cmd: ParsedCommand) -> CommandResult:
         if not cmd.args:
             # Find PR for current branch
-            current = self.repo.state.head
-            for pr in self.repo.state.pull_requests.values():
-                if pr.source_branch == current:
-                    pr_number = pr.number
-                    break
+            pr_numbers = self.repo.state.prs_by_branch.get(self.repo.state.head)
+            if pr_numbers:
+                pr_number = pr_numbers[0]
             else:
-                return CommandResult(
-                    success=False,
-                    message="no pull request found for current branch",
-                )
+                return ERR_NO_PR_FOR_BRANCH
         else:
-            try:
-                pr_number = int(cmd.args[0])
-            except ValueError:
-                return CommandResult(
-                    success=False,
-                    message="error: invalid PR number",
-                )
+            pr_number = cmd.typed.get("pr_number")
+            if pr_number is None:
+                return ERR_INVALID_PR_NUMBER
 
         if pr_number not in self.repo.state.pull_requests:
             return CommandResult(
@@ -422,39 +493,7 @@ class CommandExecutor:
         ]
 
         if pr.reviews:
-            lines.append("")
-            lines.append("Reviews:")
-            for review in pr.reviews:
-                lines.append(f"  - {review['reviewer']}: {review['status']}")
+            lines += ("", "Reviews:")
+            lines.extend(f"  - {review.reviewer}: {review.status}" for review in pr.reviews)
 
         return CommandResult(success=True, output="\n".join(lines))
-
-    def _get_general_help(self) -> str:
-        return """
-GitHub Flow Learning Tool - Available Commands
-
-Git Commands:
-  git status              Show working tree status
-  git add <file>          Stage files for commit
-  git commit -m 'msg'     Create a commit
-  git branch              List branches
-  git checkout -b <name>  Create and switch to branch
-  git checkout <branch>   Switch to existing branch
-  git push -u origin <b>  Push branch to remote
-  git pull                Pull changes from remote
-  git merge <branch>      Merge a branch
-  git log                 Show commit history
-
-GitHub CLI:
-  gh pr create            Create a pull request
-  gh pr list              List pull requests
-  gh pr merge             Merge a pull request
-  gh pr view              View pull request details
-
-App Commands:
-  help [command]          Show help for a command
-  lesson                  Show current lesson
-  lessons                 List all lessons
-  hint                    Get a hint for current step
-  quit                    Exit the application
-""".strip()
@@ -1,8 +1,14 @@
 """Command tokenization and parsing."""
 
 import shlex
+import sys
+from collections.abc import Mapping
 from dataclasses import dataclass, field
-from typing import Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Optional
+
+from .commands import ARG_SCHEMA, FLAG_BITS, GH_COMMANDS, GIT_COMMANDS, get_command_spec
 
 
 class ParseError(Exception):
@@ -10,18 +16,50 @@ class ParseError(Exception):
     pass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ParsedCommand:
-    """Result of parsing a user command."""
+    """Result of parsing a user command. Instances are cached and shared."""
     command_type: str  # "git", "gh", "internal"
     command: str  # "checkout", "commit", "pr", etc.
     subcommand: Optional[str] = None  # For "gh pr create"
-    args: list[str] = field(default_factory=list)
-    flags: dict[str, Optional[str]] = field(default_factory=dict)
+    args: tuple[str, ...] = ()
+    # flags and typed are wrapped read-only, and left out of the hash
+    flags: Mapping[str, Optional[str]] = field(default_factory=dict, hash=False)
     raw_input: str = ""
+    # Positional args converted per ARG_SCHEMA; invalid values are left out
+    typed: Mapping[str, Any] = field(default_factory=dict, hash=False)
+    # Presence bits (see FLAG_BITS) for the keys of flags
+    flag_mask: int = field(default=0, init=False, repr=False)
+    # Filled in on first call to canonical()
+    _canonical: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "flags", MappingProxyType(dict(self.flags)))
+        object.__setattr__(self, "typed", MappingProxyType(dict(self.typed)))
+        mask = 0
+        for flag in self.flags:
+            mask |= FLAG_BITS.get(flag, 0)
+        object.__setattr__(self, "flag_mask", mask)
+
+    def canonical(self) -> tuple:
+        """Hashable form that compares equal for equivalent commands."""
+        canonical = self._canonical
+        if canonical is None:
+            canonical = (
+                self.command_type,
+                self.command,
+                self.subcommand,
+                tuple(sorted(self.flags.items())),
+                self.args,
+            )
+            object.__setattr__(self, "_canonical", canonical)
+        return canonical
 
 
-INTERNAL_COMMANDS = {"help", "quit", "exit", "lesson", "lessons", "hint", "skip", "reset"}
+INTERNAL_COMMANDS = frozenset(
+    sys.intern(name)
+    for name in ("help", "quit", "exit", "lesson", "lessons", "hint", "skip", "reset")
+)
 
 
 class CommandLexer:
@@ -45,76 +83,49 @@ class CommandLexer:
             )
         """
         user_input = user_input.strip()
-        if not user_input:
-            raise ParseError("Empty command")
-
-        try:
-            tokens = shlex.split(user_input)
-        except ValueError as e:
-            raise ParseError(f"Invalid command syntax: {e}")
-
-        if not tokens:
-            raise ParseError("Empty command")
-
-        cmd_type = tokens[0].lower()
-
-        # Check for internal commands
-        if cmd_type in INTERNAL_COMMANDS:
-            return ParsedCommand(
-                command_type="internal",
-                command=cmd_type,
-                args=tokens[1:],
-                raw_input=user_input,
-            )
-
-        # Check for git or gh commands
-        if cmd_type not in ("git", "gh"):
-            raise ParseError(
-                f"Unknown command: '{cmd_type}'. Commands should start with 'git' or 'gh'."
-            )
-
-        if len(tokens) < 2:
-            raise ParseError(f"'{cmd_type}' requires a subcommand")
-
-        return self._parse_git_or_gh(tokens, cmd_type, user_input)
+        hit = _PARSE_FAST_PATH.get(user_input)
+        if hit is not None:
+            return hit
+        return _parse_stripped(user_input)
 
+    @staticmethod
     def _parse_git_or_gh(
-        self, tokens: list[str], cmd_type: str, raw_input: str
+        tokens: list[str], cmd_type: str, raw_input: str
     ) -> ParsedCommand:
         """Parse git or gh commands."""
-        command = tokens[1]
+        # Interned so handler table lookups match by identity
+        command = sys.intern(tokens[1])
         remaining = tokens[2:]
 
         # Check for sub-subcommand (gh pr create)
         subcommand = None
         if cmd_type == "gh" and command == "pr" and remaining:
-            subcommand = remaining[0]
+            subcommand = sys.intern(remaining[0])
             remaining = remaining[1:]
 
-        # Parse flags and arguments
+        # Flags the spec declares are recognized with a set lookup; anything
+        # else starting with "-" is still treated as a flag
+        spec = get_command_spec(cmd_type, command, subcommand)
+        known_flags = spec.flag_set if spec else frozenset()
+
+        # Parse flags and arguments; flag keys are interned like the command
         flags = {}
         args = []
+        count = len(remaining)
         i = 0
-        while i < len(remaining):
+        while i < count:
             token = remaining[i]
-            if token.startswith("--"):
-                # Long flag
-                if "=" in token:
+            # Slice compares rather than startswith; tokens may be empty ("")
+            if token in known_flags or (token[:1] == "-" and len(token) > 1):
+                if token[:2] == "--" and "=" in token:
+                    # Long flag with inline value
                     key, value = token.split("=", 1)
-                    flags[key] = value
-                elif i + 1 < len(remaining) and not remaining[i + 1].startswith("-"):
-                    flags[token] = remaining[i + 1]
+                    flags[sys.intern(key)] = value
+                elif i + 1 < count and remaining[i + 1][:1] != "-":
+                    flags[sys.intern(token)] = remaining[i + 1]
                     i += 1
                 else:
-                    flags[token] = None
-            elif token.startswith("-") and len(token) > 1:
-                # Short flag
-                flag = token
-                if i + 1 < len(remaining) and not remaining[i + 1].startswith("-"):
-                    flags[flag] = remaining[i + 1]
-                    i += 1
-                else:
-                    flags[flag] = None
+                    flags[sys.intern(token)] = None
             else:
                 args.append(token)
             i += 1
@@ -123,26 +134,96 @@ class CommandLexer:
             command_type=cmd_type,
             command=command,
             subcommand=subcommand,
-            args=args,
+            args=tuple(args),
             flags=flags,
             raw_input=raw_input,
+            typed=CommandLexer._convert_args(command, subcommand, args),
         )
 
+    @staticmethod
+    def _convert_args(
+        command: str, subcommand: Optional[str], args: list[str]
+    ) -> dict[str, Any]:
+        """Convert positional arguments to the types given in ARG_SCHEMA."""
+        typed = {}
+        for (name, convert), arg in zip(ARG_SCHEMA.get((command, subcommand), ()), args):
+            value = convert(arg)
+            if value is not None:
+                typed[name] = value
+        return typed
+
     def normalize(self, user_input: str) -> str:
         """Normalize a command for comparison."""
         try:
-            parsed = self.parse(user_input)
-            parts = [parsed.command_type, parsed.command]
-            if parsed.subcommand:
-                parts.append(parsed.subcommand)
-
-            # Sort flags for consistent comparison
-            for flag in sorted(parsed.flags.keys()):
-                parts.append(flag)
-                if parsed.flags[flag]:
-                    parts.append(parsed.flags[flag])
-
-            parts.extend(parsed.args)
-            return " ".join(parts)
+            cmd_type, command, subcommand, flags, args = self.parse(user_input).canonical()
         except ParseError:
             return user_input.lower().strip()
+
+        parts = [cmd_type, command]
+        if subcommand:
+            parts.append(subcommand)
+        for flag, value in flags:
+            parts.append(flag)
+            if value:
+                parts.append(value)
+        parts.extend(args)
+        return " ".join(parts)
+
+
+@lru_cache(maxsize=512)
+def _parse_stripped(user_input: str) -> ParsedCommand:
+    """Parse stripped input. Results are shared between calls, so never mutate them."""
+    if not user_input:
+        raise ParseError("Empty command")
+
+    # Without quotes or escapes shlex would only split on whitespace. str.split
+    # beats a precompiled regex findall here (~4x on typical commands), and
+    # flag shapes are classified per token in _parse_git_or_gh anyway
+    if "'" in user_input or '"' in user_input or "\\" in user_input:
+        try:
+            tokens = shlex.split(user_input)
+        except ValueError as e:
+            raise ParseError(f"Invalid command syntax: {e}")
+    else:
+        tokens = user_input.split()
+
+    if not tokens:
+        raise ParseError("Empty command")
+
+    # Interned so executor dispatch on command_type matches by identity
+    cmd_type = sys.intern(tokens[0].lower())
+
+    # git and gh are by far the most common, so check them first
+    if cmd_type == "git" or cmd_type == "gh":
+        if len(tokens) < 2:
+            raise ParseError(f"'{cmd_type}' requires a subcommand")
+        return CommandLexer._parse_git_or_gh(tokens, cmd_type, user_input)
+
+    # Check for internal commands
+    if cmd_type in INTERNAL_COMMANDS:
+        return ParsedCommand(
+            command_type="internal",
+            command=cmd_type,
+            args=tuple(tokens[1:]),
+            raw_input=user_input,
+        )
+
+    raise ParseError(
+        f"Unknown command: '{cmd_type}'. Commands should start with 'git' or 'gh'."
+    )
+
+
+# Commands that are complete without arguments (what tutorials most often ask
+# for verbatim), parsed once at import
+_PARSE_FAST_PATH: dict[str, ParsedCommand] = {
+    text: _parse_stripped.__wrapped__(text)
+    for text in (
+        *(f"git {name}" for name, spec in GIT_COMMANDS.items() if not spec.required_args),
+        *(
+            f"gh {command} {subcommand}"
+            for (command, subcommand), spec in GH_COMMANDS.items()
+            if not spec.required_args
+        ),
+        *INTERNAL_COMMANDS,
+    )
+}
@@ -1,18 +1,25 @@
 """Rich console wrapper with app-specific styling."""
 
-import math
 from collections import deque
+from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 
-from rich.console import Console
+from typing import TYPE_CHECKING, Callable, Iterator
+
+from rich.console import Console, Group
 from rich.theme import Theme
 from rich.panel import Panel
+from rich.rule import Rule
+from rich.style import Style
 from rich.text import Text
-from rich.markdown import Markdown
 
 from .regions import RegionManager
 
+if TYPE_CHECKING:
+    from rich.markdown import Markdown
+
 
 # Custom theme for the application (Claude Code inspired: orange/terracotta)
 GITGOOD_THEME = Theme({
@@ -32,6 +39,16 @@ GITGOOD_THEME = Theme({
     "header": "bold orange1",
 })
 
+# Parsed styles for messages that are built without the markup parser
+SUCCESS_STYLE = GITGOOD_THEME.styles["success"]
+SUCCESS_FADED_STYLE = GITGOOD_THEME.styles["success_faded"]
+ERROR_STYLE = GITGOOD_THEME.styles["error"]
+ERROR_FADED_STYLE = GITGOOD_THEME.styles["error_faded"]
+WARNING_STYLE = GITGOOD_THEME.styles["warning"]
+HINT_STYLE = GITGOOD_THEME.styles["hint"]
+HINT_FADED_STYLE = GITGOOD_THEME.styles["hint_faded"]
+INFO_STYLE = Style.parse("white")
+
 
 WELCOME_ART = """
    _____ _ _    _____                 _
@@ -42,6 +59,19 @@ WELCOME_ART = """
   \\_____|_|\\__|\\_____|\\___/ \\___/ \\__,_|
 """
 
+# Styled title art, built once and reused for every title render
+WELCOME_ART_TEXT = Text(WELCOME_ART, style="#c15f3c")
+TAGLINE_TEXT = Text("Learn GitHub Flow interactively!", style="bold #ffffff")
+
+# Panel titles and placeholder text, parsed once
+INSTRUCTION_TITLE = Text.from_markup("[bold #c15f3c]Instruction[/bold #c15f3c]")
+COMMENTS_TITLE = Text.from_markup("[bold #c15f3c]Comments[/bold #c15f3c]")
+NO_COMMENTS_TEXT = Text.from_markup("[dim]No feedback yet.[/dim]")
+
+# Clear screen and scrollback, then move the cursor home
+CLEAR_SCREEN = "\033[2J\033[3J\033[H"
+MOVE_HOME = "\033[H"
+
 # Minimum height for instruction panel (can expand for longer content)
 MIN_INSTRUCTION_PANEL_HEIGHT = 13
 
@@ -49,6 +79,77 @@ MIN_INSTRUCTION_PANEL_HEIGHT = 13
 COMMENTS_PANEL_HEIGHT = 10
 MAX_COMMENTS = 3  # Maximum number of comments to display
 
+# Output history kept for redraws: several screens' worth (every entry is at
+# least one row), but never fewer than MIN_OUTPUT_ENTRIES entries
+OUTPUT_HISTORY_SCREENS = 4
+MIN_OUTPUT_ENTRIES = 200
+
+
+# Static panel shown once every lesson is complete
+ALL_COMPLETE_PANEL = Panel(
+    "[success]🎉 Amazing work![/success]\n\n"
+    "You've completed all GitHub Flow lessons!\n\n"
+    "You now know how to:\n"
+    "• Create feature branches\n"
+    "• Make commits with good messages\n"
+    "• Push branches to remote\n"
+    "• Create and manage pull requests\n"
+    "• Handle code reviews\n"
+    "• Merge and clean up branches\n\n"
+    "Go forth and collaborate!",
+    title="[bold]Course Complete[/bold]",
+    border_style="green",
+    padding=(1, 2),
+)
+
+
+@lru_cache(maxsize=32)
+def _lesson_complete_panel(title: str) -> Panel:
+    """Build the completion panel for a lesson (cached per title)."""
+    return Panel(
+        f"[success]🎉 Congratulations![/success]\n\n"
+        f"You've completed: [bold]{title}[/bold]\n\n"
+        f"Type [command]lessons[/command] to continue to the next lesson.",
+        border_style="green",
+        padding=(1, 2),
+    )
+
+
+@lru_cache(maxsize=128)
+def _instruction_markdown(text: str) -> "Markdown":
+    """Parse instruction markdown (cached, since redraws repeat the same text)."""
+    # Imported on first use: the markdown parser stack is only needed
+    # once a lesson shows an instruction
+    from rich.markdown import Markdown
+
+    return Markdown(text)
+
+
+@lru_cache(maxsize=64)
+def _instruction_panel_height(text: str, width: int) -> int:
+    """Instruction panel height for text at a terminal width, allowing for line wrapping."""
+    # Panel overhead: 2 for borders + 2 for padding (1 top, 1 bottom)
+    panel_overhead = 4
+    # Available width: terminal width - borders (2) - horizontal padding (4)
+    available_width = max(width - 6, 10)  # min 10 to avoid division issues
+
+    # Each line wraps to at most len // width + 1 rows, so when that bound over
+    # the whole text still fits, the minimum height applies without counting
+    newlines = text.count('\n')
+    upper_bound = (len(text) - newlines) // available_width + newlines + 1
+    if upper_bound + panel_overhead <= MIN_INSTRUCTION_PANEL_HEIGHT:
+        return MIN_INSTRUCTION_PANEL_HEIGHT
+
+    # One row per line, plus the extra rows of lines too long to fit. Split on
+    # "\n" only, as splitlines() would also break at "\r" and other separators
+    content_lines = newlines + 1 + sum(
+        (len(line) - 1) // available_width
+        for line in text.split('\n')
+        if len(line) > available_width
+    )
+
+    return max(MIN_INSTRUCTION_PANEL_HEIGHT, content_lines + panel_overhead)
+
 
 class CommentType(Enum):
     """Type of comment message."""
@@ -58,6 +159,21 @@ class CommentType(Enum):
     HINT = "hint"
 
 
+# Message prefix and (newest, faded) styles per comment type
+COMMENT_FORMATS = {
+    CommentType.SUCCESS: ("✓ ", SUCCESS_STYLE, SUCCESS_FADED_STYLE),
+    CommentType.ERROR: ("✗ ", ERROR_STYLE, ERROR_FADED_STYLE),
+    CommentType.HINT: ("  → ", HINT_STYLE, HINT_FADED_STYLE),
+}
+
+# Markup template per comment type, for Comment.render
+COMMENT_MARKUP = {
+    CommentType.SUCCESS: "[success]✓ {}[/success]",
+    CommentType.ERROR: "[error]✗ {}[/error]",
+    CommentType.HINT: "[hint]  → {}[/hint]",
+}
+
+
 @dataclass
 class Comment:
     """A single comment in the comments panel."""
@@ -67,59 +183,87 @@ class Comment:
 
     def render(self) -> str:
         """Render the comment with appropriate styling."""
-        if self.comment_type == CommentType.SUCCESS:
-            return f"[success]✓ {self.text}[/success]"
-        elif self.comment_type == CommentType.ERROR:
-            return f"[error]✗ {self.text}[/error]"
-        elif self.comment_type == CommentType.HINT:
-            return f"[hint]  → {self.text}[/hint]"
-        return self.text
+        template = COMMENT_MARKUP.get(self.comment_type)
+        return template.format(self.text) if template else self.text
+
+
+# Rich console shared by all GitGoodConsole instances, so terminal
+# detection runs only once per process
+_shared_console: Console | None = None
+
+
+def _get_console() -> Console:
+    """Get the shared Rich console, creating it on first use."""
+    global _shared_console
+    if _shared_console is None:
+        _shared_console = Console(theme=GITGOOD_THEME)
+    return _shared_console
 
 
 class GitGoodConsole:
     """Wrapper around Rich console with app-specific methods."""
 
     def __init__(self):
-        self.console = Console(theme=GITGOOD_THEME)
-        self._output_buffer: list = []  # Accumulated output history
+        self.console = _get_console()
+        history_limit = self._output_history_limit()
+        self._output_buffer: deque = deque(maxlen=history_limit)  # Output history
+        # Output history rendered to terminal text, and the width it was rendered at
+        self._rendered_output: deque[str] = deque(maxlen=history_limit)
+        self._rendered_width = self.console.width
         self._current_instruction: str | None = None  # Current instruction text
         self._region_manager = RegionManager(self.console)
         self._comments_buffer: deque[Comment] = deque(maxlen=MAX_COMMENTS)
+        # Screen regions as last rendered: region name -> (content key, terminal text)
+        self._region_renders: dict[str, tuple] = {}
+        # Bumped on every change to the output history
+        self._output_version = 0
+        # Content of the frame last painted by _redraw, None if the screen
+        # has been written to since
+        self._frame_key: tuple | None = None
+        # Nesting depth of batch() blocks and whether one owes a redraw
+        self._batch_depth = 0
+        self._redraw_pending = False
+
+    def _output_history_limit(self) -> int:
+        """Number of output history entries to keep at the current terminal height."""
+        return max(MIN_OUTPUT_ENTRIES, self.console.size.height * OUTPUT_HISTORY_SCREENS)
 
     def _is_buffered_mode(self) -> bool:
         """Check if we're in buffered mode (instruction is active)."""
         return self._current_instruction is not None
 
-    def _clear_screen(self) -> None:
-        """Clear screen including scrollback buffer."""
-        self.console.file.write("\033[2J")  # Clear screen
-        self.console.file.write("\033[3J")  # Clear scrollback buffer
-        self.console.file.write("\033[H")   # Move cursor to home
+    def _render_title(self, clear_screen: bool = False) -> None:
+        """Render title region at top of screen, optionally clearing screen and scrollback first."""
+        title = self._rendered_region("title", (self.console.width,), self._print_title)
+        self.console.file.write((CLEAR_SCREEN if clear_screen else MOVE_HOME) + title)
         self.console.file.flush()
+        self._region_manager._title_rendered = True
+        self._frame_key = None
 
-    def _render_title(self) -> None:
-        """Render title region at top of screen."""
-        self._region_manager.move_home()
-        art = Text(WELCOME_ART)
-        art.stylize("#c15f3c")
-        self.console.print(art, justify="center")
-        self.console.print("[bold #ffffff]Learn GitHub Flow interactively![/bold #ffffff]", justify="center")
+    def _print_title(self) -> None:
+        """Print the title banner at the current cursor position."""
+        self.console.print(WELCOME_ART_TEXT, justify="center")
+        self.console.print(TAGLINE_TEXT, justify="center")
         self.console.print()
         self.console.rule(style="grey50")
         self._region_manager._title_rendered = True
 
-    def _render_comment(self, comment: Comment, is_newest: bool) -> str:
+    def _styled(self, text: str, style: Style, highlight: bool = True) -> Text:
+        """Build message text with a parsed style, bypassing the markup parser."""
+        message = self.console.render_str(text, markup=False, highlight=highlight)
+        # Applied over the highlighting, as a markup tag around the text would be
+        message.stylize(style)
+        return message
+
+    def _render_comment(self, comment: Comment, is_newest: bool) -> Text:
         """Render a comment with appropriate styling based on age."""
-        if comment.comment_type == CommentType.SUCCESS:
-            style = "success" if is_newest else "success_faded"
-            return f"[{style}]✓ {comment.text}[/{style}]"
-        elif comment.comment_type == CommentType.ERROR:
-            style = "error" if is_newest else "error_faded"
-            return f"[{style}]✗ {comment.text}[/{style}]"
-        elif comment.comment_type == CommentType.HINT:
-            style = "hint" if is_newest else "hint_faded"
-            return f"[{style}]  → {comment.text}[/{style}]"
-        return comment.text
+        prefix, newest_style, faded_style = COMMENT_FORMATS[comment.comment_type]
+        # Panel content is not highlighted
+        return self._styled(
+            prefix + comment.text,
+            newest_style if is_newest else faded_style,
+            highlight=False,
+        )
 
     def _render_comments_panel(self) -> None:
         """Render the comments panel with current comments."""
@@ -129,76 +273,144 @@ class GitGoodConsole:
             for i, comment in enumerate(self._comments_buffer):
                 is_newest = (i == num_comments - 1)
                 lines.append(self._render_comment(comment, is_newest))
-            content = "\n".join(lines)
+            content = Text("\n").join(lines)
         else:
-            content = "[dim]No feedback yet.[/dim]"
+            content = NO_COMMENTS_TEXT
 
         panel = Panel(
             content,
-            title="[bold #c15f3c]Comments[/bold #c15f3c]",
+            title=COMMENTS_TITLE,
             border_style="#c15f3c",
             padding=(0, 2),
             height=COMMENTS_PANEL_HEIGHT,
         )
-        self.console.print(panel)
-        self.console.rule(style="grey50")
+        self.console.print(Group(panel, Rule(style="grey50")))
+
+    def _instruction_panel(self) -> Panel:
+        """Build the instruction panel for the current text and width."""
+        return Panel(
+            _instruction_markdown(self._current_instruction),
+            title=INSTRUCTION_TITLE,
+            border_style="#c15f3c",
+            padding=(1, 2),
+            height=_instruction_panel_height(self._current_instruction, self.console.width),
+        )
+
+    def _print_instruction_panel(self) -> None:
+        """Print the instruction panel."""
+        self.console.print(self._instruction_panel())
+
+    def _rendered_region(self, region: str, key: tuple, paint: Callable[[], None]) -> str:
+        """Terminal text for a screen region, repainted only when its key changes."""
+        cached = self._region_renders.get(region)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        with self.console.capture() as capture:
+            paint()
+        text = capture.get()
+        self._region_renders[region] = (key, text)
+        return text
 
     def _redraw(self) -> None:
         """Clear screen and redraw everything: title + instruction + comments + output history."""
-        # Clear entire screen including scrollback buffer and re-render from scratch
-        self._clear_screen()
-        self._region_manager._title_rendered = False
-        self._render_title()
+        self._redraw_pending = False
+        width = self.console.width
+        frame_key = (
+            width, self._current_instruction, tuple(self._comments_buffer), self._output_version
+        )
+        if frame_key == self._frame_key:
+            # The screen already shows exactly this frame
+            return
+        self._frame_key = frame_key
+
+        # Assemble the whole frame off-screen, then clear the screen (including
+        # scrollback) and draw it with a single write. Regions whose content
+        # is unchanged since the last frame reuse their rendered text
+        frame = [CLEAR_SCREEN, self._rendered_region("title", (width,), self._print_title)]
+        self._region_manager._title_rendered = True
 
-        # 1. Print instruction panel with minimum height (expands for longer content)
         if self._current_instruction:
-            content = Markdown(self._current_instruction)
-            # Calculate content height accounting for line wrapping in narrow windows
-            # Panel overhead: 2 for borders + 2 for padding (1 top, 1 bottom)
-            panel_overhead = 4
-            # Available width: terminal width - borders (2) - horizontal padding (4)
-            available_width = max(self.console.width - 6, 10)  # min 10 to avoid division issues
-
-            # Count wrapped lines for each line of content
-            content_lines = 0
-            for line in self._current_instruction.split('\n'):
-                if len(line) == 0:
-                    content_lines += 1
-                else:
-                    content_lines += math.ceil(len(line) / available_width)
-
-            needed_height = content_lines + panel_overhead
-            panel_height = max(MIN_INSTRUCTION_PANEL_HEIGHT, needed_height)
-
-            panel = Panel(
-                content,
-                title="[bold #c15f3c]Instruction[/bold #c15f3c]",
-                border_style="#c15f3c",
-                padding=(1, 2),
-                height=panel_height,
+            # 1. Instruction panel with minimum height (expands for longer content)
+            frame.append(self._rendered_region(
+                "instruction", (self._current_instruction, width), self._print_instruction_panel
+            ))
+
+            # 2. Comments panel with FIXED HEIGHT
+            frame.append(self._rendered_region(
+                "comments", (tuple(self._comments_buffer), width), self._render_comments_panel
+            ))
+
+        # 3. Accumulated output (always starts at same row due to fixed panel
+        # heights), rendered once per entry and re-rendered only on resize
+        if self._rendered_width != self.console.width:
+            self._rendered_width = self.console.width
+            self._rendered_output = deque(
+                map(self._render_output, self._output_buffer), maxlen=self._output_buffer.maxlen
             )
-            self.console.print(panel)
 
-            # 2. Print comments panel with FIXED HEIGHT
-            self._render_comments_panel()
+        frame.extend(self._rendered_output)
+        self.console.file.write("".join(frame))
+        self.console.file.flush()
+
+    def _render_output(self, item) -> str:
+        """Render an output history entry to terminal text at the current width."""
+        with self.console.capture() as capture:
+            self.console.print(item)
+        return capture.get()
+
+    def _append_output(self, *items) -> None:
+        """Add entries to the output history, rendering each once."""
+        self._output_version += 1
+        if self._rendered_width != self.console.width:
+            # Stale after a resize; _redraw re-renders the whole history
+            self._output_buffer.extend(items)
+            return
+        for item in items:
+            self._output_buffer.append(item)
+            self._rendered_output.append(self._render_output(item))
+
+    def _request_redraw(self) -> None:
+        """Redraw now, or once the enclosing batch() block exits."""
+        if self._batch_depth:
+            self._redraw_pending = True
+        else:
+            self._redraw()
 
-        # 3. Print accumulated output (always starts at same row due to fixed panel heights)
-        for line in self._output_buffer:
-            self.console.print(line)
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Coalesce the redraws of several buffered print_* calls into one."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._redraw_pending:
+                self._redraw()
+
+    def invalidate(self) -> None:
+        """Note that something else wrote to the terminal, so the next redraw must repaint."""
+        self._frame_key = None
 
     def redraw(self) -> None:
         """Public method to trigger a redraw (e.g., on terminal resize)."""
         # On resize, re-render everything with new terminal dimensions
-        self.console.clear()
         self._region_manager._title_rendered = False
-        self._render_title()
+        self._frame_key = None
+        history_limit = self._output_history_limit()
+        if history_limit != self._output_buffer.maxlen:
+            # Both keep their newest entries, so they stay aligned
+            self._output_buffer = deque(self._output_buffer, maxlen=history_limit)
+            self._rendered_output = deque(self._rendered_output, maxlen=history_limit)
         if self._is_buffered_mode():
+            # _redraw clears the screen and draws the title itself
             self._redraw()
+        else:
+            self.console.clear()
+            self._render_title()
 
     def print_welcome(self) -> None:
         """Display welcome message and ASCII art."""
-        self._clear_screen()
-        self._render_title()
+        self._render_title(clear_screen=True)
         self.console.print(
             "Type [command]help[/command] to see available commands, "
             "or [command]lessons[/command] to start learning.",
@@ -214,37 +426,40 @@ class GitGoodConsole:
     def clear_instruction(self) -> None:
         """Clear the current instruction."""
         self._current_instruction = None
+        self._region_renders.pop("instruction", None)
+        self._frame_key = None
 
     def add_input_line(self, line: str) -> None:
         """Add a user input line to the output buffer."""
         if self._is_buffered_mode():
-            self._output_buffer.append(f"[bright_white]{line}[/bright_white]")
+            self._append_output(f"[bright_white]{line}[/bright_white]")
             # Don't redraw here - will redraw after command output
 
     def print_success(self, text: str) -> None:
         """Print a success message."""
         if self._is_buffered_mode():
             self._comments_buffer.append(Comment(CommentType.SUCCESS, text))
-            self._redraw()
+            self._request_redraw()
         else:
             self.console.print()
-            self.console.print(f"[success]✓ {text}[/success]")
+            self.console.print(self._styled(f"✓ {text}", SUCCESS_STYLE))
 
     def print_error(self, text: str) -> None:
         """Print an error message."""
         if self._is_buffered_mode():
             self._comments_buffer.append(Comment(CommentType.ERROR, text))
-            self._redraw()
+            self._request_redraw()
         else:
-            self.console.print(f"[error]✗ {text}[/error]")
+            self.console.print(self._styled(f"✗ {text}", ERROR_STYLE))
 
     def print_warning(self, text: str) -> None:
         """Print a warning message."""
+        message = self._styled(f"⚠ {text}", WARNING_STYLE)
         if self._is_buffered_mode():
-            self._output_buffer.append(f"[warning]⚠ {text}[/warning]")
-            self._redraw()
+            self._append_output(message)
+            self._request_redraw()
         else:
-            self.console.print(f"[warning]⚠ {text}[/warning]")
+            self.console.print(message)
 
     def print_hint(self, hints: list[str]) -> None:
         """Print helpful hints."""
@@ -253,39 +468,38 @@ class GitGoodConsole:
         if self._is_buffered_mode():
             for hint in hints:
                 self._comments_buffer.append(Comment(CommentType.HINT, hint))
-            self._redraw()
+            self._request_redraw()
         else:
             self.console.print()
-            for hint in hints:
-                self.console.print(f"[hint]  → {hint}[/hint]")
+            self.console.print(
+                Text("\n").join(self._styled(f"  → {hint}", HINT_STYLE) for hint in hints)
+            )
 
     def print_command_output(self, output: str) -> None:
         """Print simulated git command output."""
         if not output:
             return
         if self._is_buffered_mode():
-            self._output_buffer.append("")  # Blank line
-            self._output_buffer.append(output)
-            self._redraw()
+            self._append_output("", output)  # Blank line, then output
+            self._request_redraw()
         else:
             self.console.print()
             self.console.print(output)
 
     def print_info(self, text: str) -> None:
         """Print informational text."""
+        message = self._styled(f"⏺ {text}", INFO_STYLE)
         if self._is_buffered_mode():
-            self._output_buffer.append(f"[white]⏺ {text}[/white]")
-            self._redraw()
+            self._append_output(message)
+            self._request_redraw()
         else:
-            self.console.print(f"[white]⏺ {text}[/white]")
+            self.console.print(message)
 
     def print_divider(self) -> None:
         """Print a visual divider in the output."""
         if self._is_buffered_mode():
-            self._output_buffer.append("")
-            self._output_buffer.append("[dim]" + "─" * 40 + "[/dim]")
-            self._output_buffer.append("")
-            self._redraw()
+            self._append_output("", "[dim]" + "─" * 40 + "[/dim]", "")
+            self._request_redraw()
         else:
             self.console.print()
             self.console.rule(style="dim")
@@ -294,49 +508,27 @@ class GitGoodConsole:
     def print_panel(self, panel) -> None:
         """Print a panel to output buffer."""
         if self._is_buffered_mode():
-            self._output_buffer.append(panel)
-            self._redraw()
+            self._append_output(panel)
+            self._request_redraw()
         else:
             self.console.print(panel)
 
     def print_lesson_complete(self, title: str) -> None:
         """Print lesson completion message."""
-        panel = Panel(
-            f"[success]🎉 Congratulations![/success]\n\n"
-            f"You've completed: [bold]{title}[/bold]\n\n"
-            f"Type [command]lessons[/command] to continue to the next lesson.",
-            border_style="green",
-            padding=(1, 2),
-        )
+        panel = _lesson_complete_panel(title)
         if self._is_buffered_mode():
-            self._output_buffer.append("")
-            self._output_buffer.append(panel)
-            self._redraw()
+            self._append_output("", panel)
+            self._request_redraw()
         else:
             self.console.print()
             self.console.print(panel)
 
     def print_all_complete(self) -> None:
         """Print message when all lessons are complete."""
-        panel = Panel(
-            "[success]🎉 Amazing work![/success]\n\n"
-            "You've completed all GitHub Flow lessons!\n\n"
-            "You now know how to:\n"
-            "• Create feature branches\n"
-            "• Make commits with good messages\n"
-            "• Push branches to remote\n"
-            "• Create and manage pull requests\n"
-            "• Handle code reviews\n"
-            "• Merge and clean up branches\n\n"
-            "Go forth and collaborate!",
-            title="[bold]Course Complete[/bold]",
-            border_style="green",
-            padding=(1, 2),
-        )
+        panel = ALL_COMPLETE_PANEL
         if self._is_buffered_mode():
-            self._output_buffer.append("")
-            self._output_buffer.append(panel)
-            self._redraw()
+            self._append_output("", panel)
+            self._request_redraw()
         else:
             self.console.print()
             self.console.print(panel)
@@ -344,15 +536,20 @@ class GitGoodConsole:
     def clear_output_buffer(self) -> None:
         """Clear the output buffer (e.g., when starting a new lesson)."""
         self._output_buffer.clear()
+        self._rendered_output.clear()
         self._comments_buffer.clear()
+        self._output_version += 1
 
     def clear_with_title(self) -> None:
         """Clear screen, exit buffered mode, and render the title banner."""
         # Exit buffered mode if active
         self._current_instruction = None
         self._output_buffer.clear()
+        self._rendered_output.clear()
         self._comments_buffer.clear()
+        self._output_version += 1
 
-        self._clear_screen()
+        # The title screen replaces any redraw an enclosing batch() still owes
+        self._redraw_pending = False
         self._region_manager._title_rendered = False
-        self._render_title()
+        self._render_title(clear_screen=True)
@@ -1,11 +1,16 @@
 """Status and information panels."""
 
+from functools import lru_cache
+
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
+
+from ..core.models import CHANGE_TYPE_LABELS
 
 if TYPE_CHECKING:
+    from ..core.models import RepositoryStatus
     from ..core.repository import VirtualRepository
     from ..lessons.engine import Lesson
 
@@ -16,14 +21,13 @@ class StatusPanel:
     def __init__(self, repo: "VirtualRepository"):
         self.repo = repo
 
-    def render(self) -> Panel:
+    def render(self, status: Optional["RepositoryStatus"] = None) -> Panel:
         """Generate a status panel showing current repo state."""
-        status = self.repo.status()
-
-        lines = []
+        if status is None:
+            status = self.repo.status()
 
         # Current branch
-        lines.append(f"On branch [orange1 bold]{status.current_branch}[/orange1 bold]")
+        lines = [f"On branch [orange1 bold]{status.current_branch}[/orange1 bold]"]
 
         # Remote tracking info
         if status.upstream:
@@ -44,22 +48,20 @@ class StatusPanel:
 
         # Staged changes
         if status.staged:
-            lines.append("")
-            lines.append("[green]Changes to be committed:[/green]")
-            for change in status.staged:
-                lines.append(f"  [green]{change.change_type}:[/green] {change.filename}")
+            lines.extend(("", "[green]Changes to be committed:[/green]"))
+            lines.extend(
+                f"  [green]{CHANGE_TYPE_LABELS[change.change_type]}:[/green] {change.filename}"
+                for change in status.staged
+            )
 
         # Unstaged changes
         if status.unstaged:
-            lines.append("")
-            lines.append("[yellow]Changes not staged for commit:[/yellow]")
-            for filename in status.unstaged:
-                lines.append(f"  [yellow]modified:[/yellow] {filename}")
+            lines.extend(("", "[yellow]Changes not staged for commit:[/yellow]"))
+            lines.extend(f"  [yellow]modified:[/yellow] {filename}" for filename in status.unstaged)
 
         # Clean state
         if not status.staged and not status.unstaged:
-            lines.append("")
-            lines.append("[dim]nothing to commit, working tree clean[/dim]")
+            lines.extend(("", "[dim]nothing to commit, working tree clean[/dim]"))
 
         return Panel(
             "\n".join(lines),
@@ -69,6 +71,17 @@ class StatusPanel:
         )
 
 
+# Width of the lesson progress bar, in cells
+PROGRESS_BAR_WIDTH = 20
+
+
+@lru_cache(maxsize=PROGRESS_BAR_WIDTH + 1)
+def _progress_bar(filled: int) -> str:
+    """Progress bar markup with the given number of filled cells."""
+    remaining = PROGRESS_BAR_WIDTH - filled
+    return "[green]" + "█" * filled + "[/green]" + "[dim]░[/dim]" * remaining
+
+
 class LessonProgressPanel:
     """Shows current lesson progress."""
 
@@ -78,12 +91,8 @@ class LessonProgressPanel:
         current = step_index + 1
 
         # Progress bar
-        bar_width = 20
-        filled = int((step_index / max(total, 1)) * bar_width)
-        remaining = bar_width - filled
-
-        bar = "[green]" + "█" * filled + "[/green]" + "[dim]░[/dim]" * remaining
-        progress_text = f"{bar} {current}/{total}"
+        filled = int((step_index / max(total, 1)) * PROGRESS_BAR_WIDTH)
+        progress_text = f"{_progress_bar(filled)} {current}/{total}"
 
         lines = [
             f"[bold]{lesson.title}[/bold]",
@@ -93,13 +102,11 @@ class LessonProgressPanel:
             "[bold]Objectives:[/bold]",
         ]
 
-        for i, obj in enumerate(lesson.objectives):
-            if i < step_index:
-                lines.append(f"  [green]✓[/green] [dim]{obj}[/dim]")
-            elif i == step_index:
-                lines.append(f"  [yellow]→[/yellow] {obj}")
-            else:
-                lines.append(f"  [dim]○ {obj}[/dim]")
+        # Done, current and upcoming objectives
+        objectives = lesson.objectives
+        lines.extend(f"  [green]✓[/green] [dim]{obj}[/dim]" for obj in objectives[:step_index])
+        lines.extend(f"  [yellow]→[/yellow] {obj}" for obj in objectives[step_index:step_index + 1])
+        lines.extend(f"  [dim]○ {obj}[/dim]" for obj in objectives[step_index + 1:])
 
         return Panel(
             "\n".join(lines),
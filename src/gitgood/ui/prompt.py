@@ -13,6 +13,9 @@ PROMPT_STYLE = Style.from_dict({
     "branch": "ansiwhite",
 })
 
+# Upper bound on cached prompt markup (one entry per branch name)
+MAX_PROMPT_CACHE = 64
+
 
 class CommandPrompt:
     """Interactive command prompt with history and suggestions."""
@@ -24,12 +27,17 @@ class CommandPrompt:
             auto_suggest=AutoSuggestFromHistory(),
             style=PROMPT_STYLE,
         )
+        self._prompt_cache: dict[str, HTML] = {}
 
     def get_input(self, current_branch: str = "main") -> str:
         """Get user input with a git-style prompt."""
-        prompt_text = HTML(
-            f'<prompt>$</prompt> <branch>({current_branch})</branch> '
-        )
+        prompt_text = self._prompt_cache.get(current_branch)
+        if prompt_text is None:
+            prompt_text = HTML(
+                f'<prompt>$</prompt> <branch>({current_branch})</branch> '
+            )
+            if len(self._prompt_cache) < MAX_PROMPT_CACHE:
+                self._prompt_cache[current_branch] = prompt_text
 
         try:
             return self.session.prompt(prompt_text).strip()
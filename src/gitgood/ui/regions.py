@@ -6,6 +6,12 @@ from rich.console import Console
 
 # ANSI escape sequences for cursor control
 ANSI_CLEAR_TO_END = "\033[J"
+ANSI_HOME = "\033[H"
+
+
+def _move_to_row_sequence(row: int) -> str:
+    """Cursor move to column 0 of a row (ANSI uses 1-based indexing)."""
+    return f"\033[{row + 1};1H"
 
 
 @dataclass
@@ -39,18 +45,16 @@ class RegionManager:
 
     def clear_from_row(self, row: int) -> None:
         """Clear screen from specified row to bottom."""
-        # Move cursor to row, column 0 (ANSI uses 1-based indexing)
-        self.console.file.write(f"\033[{row + 1};1H")
-        # Clear from cursor to end of screen
-        self.console.file.write(ANSI_CLEAR_TO_END)
+        # Move cursor to row, then clear from cursor to end of screen
+        self.console.file.write(_move_to_row_sequence(row) + ANSI_CLEAR_TO_END)
         self.console.file.flush()
 
     def move_to_row(self, row: int) -> None:
         """Move cursor to specified row."""
-        self.console.file.write(f"\033[{row + 1};1H")
+        self.console.file.write(_move_to_row_sequence(row))
         self.console.file.flush()
 
     def move_home(self) -> None:
         """Move cursor to top-left corner."""
-        self.console.file.write("\033[H")
+        self.console.file.write(ANSI_HOME)
         self.console.file.flush()
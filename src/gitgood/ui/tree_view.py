@@ -1,14 +1,27 @@
 """Commit tree visualization."""
 
+from collections import OrderedDict
+
 from rich.panel import Panel
 from rich.text import Text
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
     from ..core.repository import VirtualRepository
     from ..core.models import Commit
 
 
+# Commit messages longer than this are cut, with "..." appended, to fit the line
+MAX_MESSAGE_LENGTH = 40
+TRUNCATED_MESSAGE_LENGTH = MAX_MESSAGE_LENGTH - 3
+
+# Number of commit histories a renderer keeps for reuse
+HISTORY_CACHE_SIZE = 16
+
+# Commit history panel title, parsed once
+HISTORY_PANEL_TITLE = Text.from_markup("[bold]Commit History[/bold]")
+
+
 class CommitTreeRenderer:
     """
     Renders a visualization of the commit graph.
@@ -17,6 +30,10 @@ class CommitTreeRenderer:
 
     def __init__(self, repo: "VirtualRepository"):
         self.repo = repo
+        # Recently walked histories, least recently used first
+        self._history_cache: OrderedDict[tuple[str, int], list["Commit"]] = OrderedDict()
+        # Last branch summary and the (state, branch_version) it was built for
+        self._summary_cache: tuple = (None, -1, "")
 
     def render(self, max_commits: int = 8) -> Panel:
         """
@@ -28,24 +45,20 @@ class CommitTreeRenderer:
         * e4f5g6h Implement authentication
         * h7i8j9k (main, origin/main) Initial commit
         """
-        lines = []
+        lines: list[str] = []
 
         # Get commits starting from current branch
+        commits = self.repo.state.commits
         current_sha = self.repo.state.branches[self.repo.state.head].commit_sha
 
-        visited = 0
-        sha = current_sha
-
-        while sha and visited < max_commits:
-            commit = self.repo.state.commits.get(sha)
-            if not commit:
-                break
-
-            line = self._format_commit_line(commit)
-            lines.append(line)
-
-            sha = commit.parent_sha
-            visited += 1
+        # Without a head commit there is nothing to walk or decorate
+        if current_sha in commits:
+            # Decorations for every decorated commit, gathered in one pass
+            decorations = self._get_decorations()
+            lines.extend(
+                self._format_commit_line(commit, decorations.get(commit.sha))
+                for commit in self._get_history(current_sha, max_commits)
+            )
 
         if not lines:
             lines.append("[dim]No commits yet[/dim]")
@@ -56,68 +69,84 @@ class CommitTreeRenderer:
             lines.append("")
             lines.append(branch_info)
 
+        # Parsed here rather than by every console render of the panel (panel
+        # content is not highlighted, so markup is all the console would apply)
         return Panel(
-            "\n".join(lines),
-            title="[bold]Commit History[/bold]",
+            Text.from_markup("\n".join(lines)),
+            title=HISTORY_PANEL_TITLE,
             border_style="yellow",
             padding=(0, 1),
         )
 
-    def _format_commit_line(self, commit: "Commit") -> str:
-        """Format a single commit line with decorations."""
-        decorations = self._get_decorations(commit.sha)
+    def _get_history(self, head_sha: str, max_commits: int) -> list["Commit"]:
+        """Get up to max_commits first-parent commits from head_sha, newest first."""
+        # Commits never change once created, so a head SHA always has the same history
+        key = (head_sha, max_commits)
+        history = self._history_cache.get(key)
+        if history is not None:
+            self._history_cache.move_to_end(key)
+            return history
+
+        commits = self.repo.state.commits
+        history = []
+        # Stops the walk on a malformed graph whose parent links form a cycle
+        seen: set[str] = set()
+        sha = head_sha
+        while sha and len(history) < max_commits and sha not in seen:
+            commit = commits.get(sha)
+            if not commit:
+                break
+            seen.add(sha)
+            history.append(commit)
+            sha = commit.parent_sha
 
-        # Build the line
-        parts = ["[dim]*[/dim]", f"[yellow]{commit.sha}[/yellow]"]
+        self._history_cache[key] = history
+        if len(self._history_cache) > HISTORY_CACHE_SIZE:
+            self._history_cache.popitem(last=False)
+        return history
 
-        if decorations:
-            dec_str = ", ".join(decorations)
-            parts.append(f"[orange1]({dec_str})[/orange1]")
+    def _format_commit_line(self, commit: "Commit", decorations: Optional[list[str]]) -> str:
+        """Format a single commit line with decorations."""
+        dec_part = f" [orange1]({', '.join(decorations)})[/orange1]" if decorations else ""
 
-        # Truncate message if too long
         message = commit.message
-        if len(message) > 40:
-            message = message[:37] + "..."
-
-        parts.append(message)
-
-        return " ".join(parts)
-
-    def _get_decorations(self, sha: str) -> list[str]:
-        """Get branch/HEAD decorations for a commit."""
-        decorations = []
-
-        # Check if HEAD points here
-        current_branch = self.repo.state.head
-        if self.repo.state.branches[current_branch].commit_sha == sha:
-            decorations.append(f"[bold green]HEAD -> {current_branch}[/bold green]")
-
-        # Check other local branches
-        for name, branch in self.repo.state.branches.items():
-            if branch.commit_sha == sha and name != current_branch:
-                decorations.append(f"[green]{name}[/green]")
-
-        # Check remote branches
-        for name, branch in self.repo.state.remote_branches.items():
-            if branch.commit_sha == sha:
-                decorations.append(f"[red]{name}[/red]")
+        if len(message) > MAX_MESSAGE_LENGTH:
+            message = message[:TRUNCATED_MESSAGE_LENGTH] + "..."
+
+        return f"[dim]*[/dim] [yellow]{commit.sha}[/yellow]{dec_part} {message}"
+
+    def _get_decorations(self) -> dict[str, list[str]]:
+        """Get branch/HEAD decorations, keyed by commit SHA."""
+        state = self.repo.state
+        current_branch = state.head
+
+        # HEAD first, then other local branches, then remote branches
+        decorations: dict[str, list[str]] = {}
+        for name, branch in state.branches.items():
+            commit_decorations = decorations.setdefault(branch.commit_sha, [])
+            if name == current_branch:
+                commit_decorations.insert(0, f"[bold green]HEAD -> {name}[/bold green]")
+            else:
+                commit_decorations.append(f"[green]{name}[/green]")
+        for name, branch in state.remote_branches.items():
+            decorations.setdefault(branch.commit_sha, []).append(f"[red]{name}[/red]")
 
         return decorations
 
     def _get_branch_summary(self) -> str:
         """Get a summary of all branches."""
-        branches = []
-
-        for name in sorted(self.repo.state.branches.keys()):
-            if name == self.repo.state.head:
-                branches.append(f"[green bold]* {name}[/green bold]")
-            else:
-                branches.append(f"[dim]  {name}[/dim]")
-
-        return "Branches: " + " ".join(
-            f"[green]{name}[/green]" if name == self.repo.state.head else f"[dim]{name}[/dim]"
-            for name in sorted(self.repo.state.branches.keys())
+        state = self.repo.state
+        cached_state, version, summary = self._summary_cache
+        if cached_state is state and version == state.branch_version:
+            return summary
+
+        head = state.head
+        summary = "Branches: " + " ".join(
+            f"[green]{name}[/green]" if name == head else f"[dim]{name}[/dim]"
+            for name in state.sorted_branch_names
         )
+        self._summary_cache = (state, state.branch_version, summary)
+        return summary
 
 
 class SimpleTreeView:
@@ -125,17 +154,20 @@ class SimpleTreeView:
 
     def __init__(self, repo: "VirtualRepository"):
         self.repo = repo
+        # Last output and the (state, branch_version) it was built for
+        self._oneline_cache: tuple = (None, -1, "")
 
     def render_oneline(self) -> str:
         """Render a single-line branch status."""
-        current = self.repo.state.head
-        branches = list(self.repo.state.branches.keys())
-
-        parts = []
-        for name in sorted(branches):
-            if name == current:
-                parts.append(f"[green bold]*{name}[/green bold]")
-            else:
-                parts.append(f"[dim]{name}[/dim]")
-
-        return " ".join(parts)
+        state = self.repo.state
+        cached_state, version, oneline = self._oneline_cache
+        if cached_state is state and version == state.branch_version:
+            return oneline
+
+        current = state.head
+        oneline = " ".join(
+            f"[green bold]*{name}[/green bold]" if name == current else f"[dim]{name}[/dim]"
+            for name in state.sorted_branch_names
+        )
+        self._oneline_cache = (state, state.branch_version, oneline)
+        return oneline